@@ -1,5 +1,6 @@
 Feature: Browser Window Handling
 
+  @click_navigation
   Scenario: Open and validate a new browser window
     Given I navigate to https://demoqa.com/
     When I click the "Alerts, Frame & Windows" card
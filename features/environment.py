@@ -10,24 +10,230 @@ Description:
 """
 
 import time
+from functools import partial
+from pathlib import Path
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from support.artifacts import FailureCapture
+from support.browser import BrowserProfile, LoadTimes, create_driver
+from support.cdp_channel import open_channel
+from support.data_factory import DataFactory
+from support.driver_pool import DriverPool
+from support.driver_resolver import get_resolver
+from support.instrumentation import Instrumentation
+from support.local_site import LocalSite
+from support.pages import Pages
+from support.replay import CommandRecorder
+from support.reporting import report
+from support.rerun import RunState, enable_retries
+from support.settle import SettleEngine
+from support.visual import VisualCheckpoints
+
+
+def before_all(context):
+    userdata = context.config.userdata
+    context.driver_resolver = get_resolver(
+        offline=userdata.getbool("driver_offline", False),
+        driver_path=userdata.get("chromedriver") or None,
+    )
+
+    context.browser_profile = BrowserProfile.from_userdata(userdata)
+    context.load_times = None
+    if userdata.getbool("load_times", False):
+        context.load_times = LoadTimes(context.browser_profile.mode)
+
+    context.site = None
+    context.site_url = None
+    if userdata.get("site", "remote") == "local":
+        context.site = LocalSite()
+        context.site_url = context.site.start()
+
+    context.driver_pool = None
+    if userdata.getbool("driver_pool", False):
+        context.driver_pool = DriverPool(
+            partial(create_driver, context.browser_profile),
+            size=userdata.getint("pool_size", 1),
+            recycle_after=userdata.getint("recycle_after", 0),
+        )
+
+    context.settle_engine = None
+    if userdata.getbool("settle", True):
+        context.settle_engine = SettleEngine(
+            quiet_ms=userdata.getint("settle_quiet_ms", 150),
+            timeout_ms=userdata.getint("settle_timeout_ms", 1000),
+        )
+
+    data_seed = userdata.get("data_seed", "")
+    context.data_factory = DataFactory(
+        seed=int(data_seed) if data_seed else None,
+        worker_id=userdata.get("worker_id"),
+    )
+
+    context.locator_stats = {"hits": 0, "misses": 0, "stale": 0}
+
+    context.failure_capture = None
+    if userdata.getbool("failure_artifacts", True):
+        context.failure_capture = FailureCapture(
+            output_dir=userdata.get("artifacts_dir", "reports/failures"),
+            history=userdata.getint("command_history", 50),
+        )
+
+    context.visual = None
+    if userdata.getbool("visual", False):
+        context.visual = VisualCheckpoints(
+            baseline_dir=Path(userdata.get("visual_baselines", "resources/baselines")) / userdata.get("site", "remote"),
+            cache_dir=Path(".cache/visual") / userdata.get("site", "remote"),
+            tolerance=float(userdata.get("visual_tolerance", "0.001")),
+            threshold=userdata.getint("visual_threshold", 16),
+            update=userdata.getbool("visual_update", False),
+        )
+
+    context.upload_timings = []
+    context.attribute_watches = []
+    context.form_fills = []
+
+    context.run_state = RunState()
+    context.retries = userdata.getint("retries", 0)
+
+    context.recorder = None
+    if userdata.get("record"):
+        context.recorder = CommandRecorder(userdata.get("record"), site_url=context.site_url)
+
+    context.instrumentation = None
+    if userdata.getbool("instrument", False):
+        context.instrumentation = Instrumentation()
+        context.instrumentation.install()
+
+
+def before_feature(context, feature):
+    if context.retries:
+        enable_retries(feature, context.retries)
 
 
 def before_scenario(context, scenario):
-    options = webdriver.ChromeOptions()
-    service = Service(ChromeDriverManager().install())
-    context.driver = webdriver.Chrome(service=service, options=options)
-    context.driver.maximize_window()
+    context.data = context.data_factory.stream(f"{scenario.filename}:{scenario.name}")
+    started = time.perf_counter()
+    if context.driver_pool is not None:
+        launches = context.driver_pool.launches
+        context.driver = context.driver_pool.acquire()
+        launched = context.driver_pool.launches > launches
+    else:
+        context.driver = create_driver(context.browser_profile)
+        launched = True
+    if context.instrumentation is not None:
+        context.instrumentation.record_browser_start(time.perf_counter() - started, launched)
+        context.instrumentation.wrap_driver(context.driver)
+    if context.failure_capture is not None:
+        context.failure_capture.attach(context.driver)
+        context.failure_capture.begin(scenario)
+    if context.recorder is not None:
+        context.recorder.attach(context.driver)
+        context.recorder.begin(scenario)
+    context.channel = None
+    if context.config.userdata.get("channel", "webdriver") == "cdp":
+        recorder = context.instrumentation.record_channel_command if context.instrumentation is not None else None
+        context.channel = open_channel(context.driver, recorder=recorder)
+    on_navigate = context.load_times.record if context.load_times is not None else None
+    context.pages = Pages(context.driver, on_navigate=on_navigate, channel=context.channel)
 
 
 def after_scenario(context, scenario):
+    context.run_state.record(scenario)
+    if hasattr(context, "pages"):
+        for key, value in context.pages.stats().items():
+            context.locator_stats[key] += value
+    if context.recorder is not None:
+        context.recorder.end(scenario)
+    if getattr(context, "channel", None) is not None:
+        context.channel.close()
     if hasattr(context, "driver"):
-        context.driver.quit()
+        if context.driver_pool is not None:
+            context.driver_pool.release(context.driver)
+        else:
+            context.driver.quit()
+
+
+def before_step(context, step):
+    if context.instrumentation is not None:
+        context.instrumentation.start_step(context.feature, context.scenario, step)
 
 
 def after_step(context, step):
-    time.sleep(1)
+    if step.status.has_failed() and context.failure_capture is not None:
+        context.failure_capture.capture(context.driver, context.scenario, step)
+    settle_after_step(context, step)
+    if context.instrumentation is not None:
+        context.instrumentation.end_step(step)
+
+
+def settle_after_step(context, step):
+    if context.settle_engine is None:
+        time.sleep(1)
+        return
+    if getattr(context, "skip_settle", False) or step.status.has_failed():
+        context.skip_settle = False
+        context.settle_engine.skip(step.name)
+        return
+    context.settle_engine.settle(context.driver, step.name)
+
 
+def after_all(context):
+    if context.site is not None:
+        context.site.stop()
+    report("ChromeDriver", context.driver_resolver.summary_lines())
+    if context.driver_pool is not None:
+        context.driver_pool.close()
+        report("Driver pool", context.driver_pool.summary_lines())
+    if context.settle_engine is not None:
+        report("Step settling", context.settle_engine.summary_lines())
+    report("Test data", context.data_factory.summary_lines())
+    if context.upload_timings:
+        report("Uploads", [
+            f"{upload['file']}: {upload['size'] / 1024 ** 2:.1f} MB accepted in {upload['accept_seconds']:.2f}s "
+            f"(send_keys {upload['send_keys_seconds']:.2f}s, {upload['throughput_mb_s']:.0f} MB/s"
+            f"{', generated' if upload['generated'] else ', cached'})"
+            for upload in context.upload_timings
+        ])
+    if context.form_fills:
+        report("Form filling", [
+            f"forms filled: {len(context.form_fills)}, "
+            f"fields scripted: {sum(len(fill['scripted']) for fill in context.form_fills)}, "
+            f"fields through WebDriver fallbacks: {sum(len(fill['fallback']) for fill in context.form_fills)}",
+            f"WebDriver round trips saved: {sum(fill['round_trips_saved'] for fill in context.form_fills)}",
+        ])
+    if context.attribute_watches:
+        report("Progress bar stop", [
+            f"stopped at {watch['value']} after {watch['values_seen']} observed values, "
+            f"stop clicked {watch['latency_ms']:.1f} ms after the match"
+            for watch in context.attribute_watches
+        ])
+    if context.visual is not None and context.visual.stats["checks"]:
+        report("Visual checkpoints", context.visual.summary_lines())
+    # Parallel workers leave the state file to the runner, which sees every worker's results.
+    if context.config.userdata.get("worker_id") is None:
+        state = context.run_state.save()
+        if state["failed"] or context.run_state.flaky():
+            report("Rerun state", context.run_state.summary_lines(state))
+    if context.failure_capture is not None:
+        write_errors = context.failure_capture.close()
+        if context.failure_capture.captured or write_errors:
+            report("Failure artifacts", context.failure_capture.summary_lines(write_errors))
+    stats = context.locator_stats
+    report("Element cache", [
+        f"lookups: {stats['hits'] + stats['misses']}",
+        f"cache hits: {stats['hits']} (lookups saved)",
+        f"stale handles re-resolved: {stats['stale']}",
+    ])
+    if context.recorder is not None:
+        context.recorder.write()
+        report("Command recording", context.recorder.summary_lines())
+    if context.browser_profile.profile_store is not None:
+        report("Browser profile", context.browser_profile.profile_store.summary_lines())
+    if context.load_times is not None:
+        data = context.load_times.write(context.config.userdata.get("load_times_report", "reports/load_times.json"))
+        report("Page load times", context.load_times.summary_lines(data))
+    if context.instrumentation is not None:
+        context.instrumentation.uninstall()
+        report_path = context.instrumentation.write(
+            context.config.userdata.get("instrument_report", "reports/instrumentation.json")
+        )
+        report("Instrumentation", context.instrumentation.summary_lines() + [f"report: {report_path}"])
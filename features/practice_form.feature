@@ -8,5 +8,23 @@ Feature: DemoQA Practice Form
     And I upload the sample text file
     And I submit the form
     Then a confirmation popup should appear
+    And the "modal" element on the "practice_form" page should match the "practice-form-confirmation" checkpoint ignoring "modal_values"
     And I close the confirmation popup
 
+
+  Scenario Outline: Upload a generated <size> <type> file
+    Given I navigate to the DemoQA homepage
+    When I click on the "Forms" card
+    And I click on the "Practice Form" submenu item
+    And I upload a generated <size> <type> file
+    Then the upload input should hold the generated file
+
+    Examples:
+      | size  | type |
+      | 100KB | txt  |
+      | 5MB   | png  |
+
+    @large_upload
+    Examples: Large files
+      | size  | type |
+      | 200MB | pdf  |
@@ -9,6 +9,7 @@ Feature: DemoQA Progress Bar
     Then the progress bar value should be less than or equal to 25
     When I click the "Start" button again
     And I wait for the progress to reach 100 percent
-    And I click the "Reset" button
+    Then the "container" element on the "progress_bar" page should match the "progress-bar-complete" checkpoint
+    When I click the "Reset" button
     Then the progress bar should be reset to 0 percent
 
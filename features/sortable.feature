@@ -7,3 +7,11 @@ Feature: Sortable List Interaction
     And I sort the list items into ascending order
     Then the list items should be in ascending order
 
+
+  Scenario: Sort the grid items into descending order
+    Given I navigate to the DemoQA homepage at "https://demoqa.com/"
+    When I click on the "Interactions" card
+    And I select the "Sortable" submenu
+    And I sort the grid items into descending order
+    Then the grid items should be in descending order
+    And the "grid" element on the "sortable" page should match the "sortable-grid-descending" checkpoint
@@ -9,97 +9,70 @@ Description:
 
 """
 
-import random
 from datetime import datetime
 from pathlib import Path
 
 from assertpy import assert_that
 from behave import given, when, then
-from faker import Faker
 from selenium.webdriver import ActionChains
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+
+from support import waits as EC
+from support.form_filler import fill_form
+from support.navigation import open_card, open_homepage, open_submenu
+from support.upload_files import generated_file, upload_file
 
 
-fake = Faker()
 BASE_DIR = Path(__file__).resolve().parents[2]
 RESOURCES_DIR = BASE_DIR / "resources"
 SAMPLE_FILE = RESOURCES_DIR / "sample_file.txt"
 
 
-def scroll_into_view(driver, element):
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-
-
 @given("I navigate to the DemoQA homepage")
 def step_navigate_homepage(context):
-    context.driver.get("https://demoqa.com/")
+    open_homepage(context, "https://demoqa.com/")
 
 
 @when('I click on the "Forms" card')
 def step_click_forms_card(context):
-    driver = context.driver
-    forms_card = driver.find_element(By.XPATH, "//h5[text()='Forms']/ancestor::div[contains(@class, 'top-card')]")
-    scroll_into_view(driver, forms_card)
-    forms_card.click()
+    open_card(context, "Forms")
 
 
 @when('I click on the "Practice Form" submenu item')
 def step_click_practice_form(context):
-    driver = context.driver
-    practice_form = driver.find_element(By.XPATH, "//span[text()='Practice Form']")
-    scroll_into_view(driver, practice_form)
-    practice_form.click()
+    open_submenu(context, "Practice Form")
 
 
-@when("I fill out the practice form with random data")
-def step_fill_out_form(context):
-    driver = context.driver
+def select_birth_date(page, target_date):
+    page.click("birth_date", scroll=False)
+    page.type("month_select", target_date.strftime("%B"))
+    page.type("year_select", str(target_date.year))
+    page.click("day", scroll=False, day=target_date.day)
 
-    first_name = driver.find_element(By.ID, "firstName")
-    last_name = driver.find_element(By.ID, "lastName")
-    email = driver.find_element(By.ID, "userEmail")
-    mobile = driver.find_element(By.ID, "userNumber")
-    address = driver.find_element(By.ID, "currentAddress")
 
-    genders = driver.find_elements(By.XPATH, "//label[contains(@for, 'gender-radio')]")
-    hobbies = driver.find_elements(By.XPATH, "//label[contains(@for, 'hobbies-checkbox')]")
+def select_subject(page, subject):
+    page.type("subjects", subject)
+    ActionChains(page.driver).move_to_element(page.find("subjects")).send_keys(Keys.RETURN).perform()
 
-    first_name.send_keys(fake.first_name())
-    last_name.send_keys(fake.last_name())
-    email.send_keys(fake.email())
-    mobile.send_keys(fake.msisdn()[:10])
-    address.send_keys(fake.street_address())
 
-    gender_choice = random.choice(genders)
-    scroll_into_view(driver, gender_choice)
-    gender_choice.click()
+def select_react_option(page, container, option_prefix, value):
+    page.click(container)
+    option = page.wait_for("select_option", EC.element_to_be_clickable, prefix=option_prefix, value=value)
+    option.click()
 
-    hobby_choice = random.choice(hobbies)
-    scroll_into_view(driver, hobby_choice)
-    hobby_choice.click()
 
-    birth_date_input = driver.find_element(By.ID, "dateOfBirthInput")
-    birth_date_input.click()
+def form_fallbacks(page):
+    return {
+        "dateOfBirthInput": lambda value: select_birth_date(page, value),
+        "subjectsInput": lambda value: select_subject(page, value),
+        "state": lambda value: select_react_option(page, "state", "react-select-3-option", value),
+        "city": lambda value: select_react_option(page, "city", "react-select-4-option", value),
+    }
 
-    # Set date to a fixed middle value for consistency
-    target_date = datetime(fake.random_int(min=1990, max=2000), 6, 15)
-    month_selector = driver.find_element(By.CLASS_NAME, "react-datepicker__month-select")
-    year_selector = driver.find_element(By.CLASS_NAME, "react-datepicker__year-select")
-    month_selector.send_keys(target_date.strftime("%B"))
-    year_selector.send_keys(str(target_date.year))
-
-    day_selector = driver.find_element(
-        By.XPATH,
-        f"//div[contains(@class,'react-datepicker__day--0{target_date.day:02d}') and not(contains(@class,'--outside-month'))]",
-    )
-    day_selector.click()
-
-    subjects_input = driver.find_element(By.ID, "subjectsInput")
-    subjects_input.send_keys("Maths")
-    ActionChains(driver).move_to_element(subjects_input).send_keys(Keys.RETURN).perform()
+
+@when("I fill out the practice form with random data")
+def step_fill_out_form(context):
+    page = context.pages["practice_form"]
 
     state_city_pairs = [
         ("NCR", "Delhi"),
@@ -107,53 +80,64 @@ def step_fill_out_form(context):
         ("Haryana", "Karnal"),
         ("Rajasthan", "Jaipur"),
     ]
-    state_value, city_value = random.choice(state_city_pairs)
-
-    state_container = driver.find_element(By.ID, "state")
-    scroll_into_view(driver, state_container)
-    state_container.click()
-    state_option = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.XPATH, f"//div[contains(@id,'react-select-3-option') and text()='{state_value}']"))
-    )
-    state_option.click()
+    state_value, city_value = context.data.random.choice(state_city_pairs)
+    person = context.data.next()
 
-    city_container = driver.find_element(By.ID, "city")
-    scroll_into_view(driver, city_container)
-    city_container.click()
-    city_option = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.XPATH, f"//div[contains(@id,'react-select-4-option') and text()='{city_value}']"))
-    )
-    city_option.click()
+    # Set date to a fixed middle value for consistency
+    target_date = datetime(person["birth_year"], 6, 15)
+
+    values = {
+        "firstName": person["first_name"],
+        "lastName": person["last_name"],
+        "userEmail": person["email"],
+        "userNumber": person["phone"],
+        "currentAddress": person["address"],
+        f"gender-radio-{context.data.random.randint(1, 3)}": True,
+        f"hobbies-checkbox-{context.data.random.randint(1, 3)}": True,
+        "dateOfBirthInput": target_date,
+        "subjectsInput": "Maths",
+        "state": state_value,
+        "city": city_value,
+    }
+    context.form_fill_result = fill_form(context.driver, values, form_fallbacks(page))
+    context.form_fills.append(context.form_fill_result)
 
 
 @when("I upload the sample text file")
 def step_upload_file(context):
-    driver = context.driver
-    upload_input = driver.find_element(By.ID, "uploadPicture")
-    upload_input.send_keys(str(SAMPLE_FILE))
+    context.pages["practice_form"].type("upload", str(SAMPLE_FILE))
+
+
+@when('I upload a generated {size} {file_type} file')
+def step_upload_generated_file(context, size, file_type):
+    path, created = generated_file(size, file_type)
+    page = context.pages["practice_form"]
+    context.upload_result = upload_file(context.driver, page.find("upload"), path)
+    context.upload_result["generated"] = created
+    context.upload_timings.append(context.upload_result)
+
+
+@then("the upload input should hold the generated file")
+def step_verify_generated_upload(context):
+    result = context.upload_result
+    assert_that(result["accepted_name"]).is_equal_to(result["file"])
 
 
 @when("I submit the form")
 def step_submit_form(context):
-    driver = context.driver
-    submit_button = driver.find_element(By.ID, "submit")
-    scroll_into_view(driver, submit_button)
-    submit_button.click()
+    context.pages["practice_form"].click("submit")
 
 
 @then("a confirmation popup should appear")
 def step_verify_popup(context):
-    driver = context.driver
-    wait = WebDriverWait(driver, 10)
-    modal = wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "modal-content")))
-    assert_that(modal.is_displayed()).is_true()
+    page = context.pages["practice_form"]
+    page.wait_for("modal")
+    assert_that(page.is_displayed("modal")).is_true()
 
 
 @then("I close the confirmation popup")
 def step_close_popup(context):
-    driver = context.driver
-    wait = WebDriverWait(driver, 10)
-    close_button = wait.until(EC.element_to_be_clickable((By.ID, "closeLargeModal")))
-    scroll_into_view(driver, close_button)
-    driver.execute_script("arguments[0].click();", close_button)
-
+    page = context.pages["practice_form"]
+    close_button = page.wait_for("close_modal", EC.element_to_be_clickable)
+    page.scroll_into_view(close_button)
+    context.driver.execute_script("arguments[0].click();", close_button)
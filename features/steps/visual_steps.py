@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Step definitions for visual checkpoints against stored baselines.
+
+"""
+
+from behave import then
+
+
+def check_element(context, page_name, element, checkpoint, masks=()):
+    if context.visual is None:
+        return
+    page = context.pages[page_name]
+    target = page.wait_for(element)
+    page.scroll_into_view(target)
+    mask_elements = []
+    for mask in masks:
+        found = page.find_all(mask)
+        # An empty mask would let volatile content into the comparison unnoticed.
+        if not found:
+            raise AssertionError(f"Mask {mask!r} on the {page_name} page matched no elements")
+        mask_elements.extend(found)
+    context.visual.check(context.driver, checkpoint, element=target, masks=mask_elements)
+
+
+@then('the "{element}" element on the "{page}" page should match the "{checkpoint}" checkpoint')
+def step_check_element(context, element, page, checkpoint):
+    check_element(context, page, element, checkpoint)
+
+
+@then('the "{element}" element on the "{page}" page should match the "{checkpoint}" checkpoint ignoring "{masks}"')
+def step_check_element_masked(context, element, page, checkpoint, masks):
+    check_element(context, page, element, checkpoint, [mask.strip() for mask in masks.split(",")])
@@ -11,201 +11,182 @@ Description:
 
 from assertpy import assert_that
 from behave import given, when, then
-from faker import Faker
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support.ui import Select
 
+from support import waits as EC
+from support.navigation import open_card, open_homepage, open_submenu
+from support.waits import WebDriverWait
+from support.web_tables import TableIndex, seed_records
 
-fake = Faker()
 
+FORM_ELEMENTS = ("form", "first_name", "last_name", "email", "age", "salary", "department", "submit")
 
-def scroll_into_view(driver, element):
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
 
-
-def set_rows_per_page(driver, size=20):
+def set_rows_per_page(page, size=20):
     try:
-        select_element = WebDriverWait(driver, 5).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "select[aria-label='rows per page']"))
-        )
+        select_element = page.wait_for("rows_per_page", EC.element_to_be_clickable, timeout=5)
         Select(select_element).select_by_value(str(size))
-        WebDriverWait(driver, 5).until(
-            EC.text_to_be_present_in_element_value((By.CSS_SELECTOR, "select[aria-label='rows per page']"), str(size))
+        WebDriverWait(page.driver, 5).until(
+            EC.text_to_be_present_in_element_value(page.locator("rows_per_page"), str(size))
         )
     except TimeoutException:
         pass
 
 
+def build_random_record(context):
+    record = context.data.next()
+    return {key: record[key] for key in ("first_name", "last_name", "email", "age", "salary", "department")}
+
+
 @given('I navigate to the DemoQA homepage at "{url}"')
 def step_navigate_homepage(context, url):
-    context.driver.get(url)
+    open_homepage(context, url)
 
 
 @when('I click on the "Elements" card')
 def step_click_elements_card(context):
-    driver = context.driver
-    elements_card = driver.find_element(By.XPATH, "//h5[text()='Elements']/ancestor::div[contains(@class, 'top-card')]")
-    scroll_into_view(driver, elements_card)
-    elements_card.click()
+    open_card(context, "Elements")
 
 
 @when('I click the "Web Tables" submenu item')
 def step_click_web_tables_submenu(context):
-    driver = context.driver
-    submenu = driver.find_element(By.XPATH, "//span[text()='Web Tables']")
-    scroll_into_view(driver, submenu)
-    submenu.click()
-    set_rows_per_page(driver, 20)
+    open_submenu(context, "Web Tables")
+    set_rows_per_page(context.pages["web_tables"], 20)
+    context.table_index = TableIndex(context.driver)
+
+
+def submit_form(page):
+    page.click("submit", scroll=False)
+    # The dialog is rebuilt every time it opens, so its handles never carry over.
+    for element in FORM_ELEMENTS:
+        page.forget(element)
 
 
 @when('I add a new record to the table with random data')
 def step_add_new_record(context):
-    driver = context.driver
-    add_button = driver.find_element(By.ID, "addNewRecordButton")
-    scroll_into_view(driver, add_button)
-    add_button.click()
-
-    context.first_name = fake.first_name()
-    context.last_name = fake.last_name()
-    context.user_email = fake.unique.email()
-    context.age = str(fake.random_int(min=18, max=65))
-    context.salary = str(fake.random_int(min=30000, max=150000))
-    context.department = fake.job()
-
-    driver.find_element(By.ID, "firstName").send_keys(context.first_name)
-    driver.find_element(By.ID, "lastName").send_keys(context.last_name)
-    driver.find_element(By.ID, "userEmail").send_keys(context.user_email)
-    driver.find_element(By.ID, "age").send_keys(context.age)
-    driver.find_element(By.ID, "salary").send_keys(context.salary)
-    driver.find_element(By.ID, "department").send_keys(context.department)
-    driver.find_element(By.ID, "submit").click()
-
-
-def find_row_by_email(driver, email):
-    wait = WebDriverWait(driver, 5)
-    return wait.until(
-        EC.presence_of_element_located(
-            (
-                By.XPATH,
-                f"//div[@role='rowgroup']/div[@role='row'][.//div[text()='{email}']]",
-            )
-        )
-    )
+    page = context.pages["web_tables"]
+    page.click("add_button")
+
+    record = build_random_record(context)
+    context.first_name = record["first_name"]
+    context.last_name = record["last_name"]
+    context.user_email = record["email"]
+    context.age = record["age"]
+    context.salary = record["salary"]
+    context.department = record["department"]
+
+    page.type("first_name", context.first_name)
+    page.type("last_name", context.last_name)
+    page.type("email", context.user_email)
+    page.type("age", context.age)
+    page.type("salary", context.salary)
+    page.type("department", context.department)
+    submit_form(page)
+    context.table_index.invalidate()
+
+
+def find_row_by_email(page, email):
+    try:
+        return page.find("row_by_email", email=email)
+    except NoSuchElementException:
+        return page.wait_for("row_by_email", EC.presence_of_element_located, timeout=5, email=email)
+
+
+def click_row_action(page, email, action):
+    find_row_by_email(page, email)
+
+    def click(row):
+        button = row.find_element(*page.locator(action))
+        page.scroll_into_view(button)
+        button.click()
+
+    page.use("row_by_email", click, email=email)
+
+
+def wait_for_row_removed(page, email):
+    WebDriverWait(page.driver, 5).until(EC.invisibility_of_element_located(page.locator("cell", text=email)))
+    page.forget("row_by_email", email=email)
 
 
 @when('I edit the first name of the newly created record')
 def step_edit_record(context):
-    driver = context.driver
-    row = find_row_by_email(driver, context.user_email)
-    edit_button = row.find_element(By.CSS_SELECTOR, "span[title='Edit']")
-    scroll_into_view(driver, edit_button)
-    edit_button.click()
-
-    first_name_input = driver.find_element(By.ID, "firstName")
-    first_name_input.clear()
-    first_name_input.send_keys("EditedName")
-    driver.find_element(By.ID, "submit").click()
+    page = context.pages["web_tables"]
+    click_row_action(page, context.user_email, "edit_button")
+    page.type("first_name", "EditedName", clear=True)
+    submit_form(page)
+    context.table_index.invalidate()
 
 
 @when('I delete the newly created record')
 def step_delete_record(context):
-    driver = context.driver
-    row = find_row_by_email(driver, context.user_email)
-    delete_button = row.find_element(By.CSS_SELECTOR, "span[title='Delete']")
-    scroll_into_view(driver, delete_button)
-    delete_button.click()
-    WebDriverWait(driver, 5).until(
-        EC.invisibility_of_element_located((By.XPATH, f"//div[text()='{context.user_email}']"))
-    )
+    page = context.pages["web_tables"]
+    click_row_action(page, context.user_email, "delete_button")
+    wait_for_row_removed(page, context.user_email)
+    context.table_index.invalidate()
 
 
-def build_random_record():
-    return {
-        "first_name": fake.first_name(),
-        "last_name": fake.last_name(),
-        "email": fake.unique.email(),
-        "age": str(fake.random_int(min=18, max=65)),
-        "salary": str(fake.random_int(min=30000, max=150000)),
-        "department": fake.job(),
-    }
-
-
-def submit_registration_form(driver, data):
-    form = WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.ID, "userForm")))
-    form.find_element(By.ID, "firstName").clear()
-    form.find_element(By.ID, "firstName").send_keys(data["first_name"])
-    form.find_element(By.ID, "lastName").clear()
-    form.find_element(By.ID, "lastName").send_keys(data["last_name"])
-    form.find_element(By.ID, "userEmail").clear()
-    form.find_element(By.ID, "userEmail").send_keys(data["email"])
-    form.find_element(By.ID, "age").clear()
-    form.find_element(By.ID, "age").send_keys(data["age"])
-    form.find_element(By.ID, "salary").clear()
-    form.find_element(By.ID, "salary").send_keys(data["salary"])
-    form.find_element(By.ID, "department").clear()
-    form.find_element(By.ID, "department").send_keys(data["department"])
-    form.find_element(By.ID, "submit").click()
+def submit_registration_form(page, data):
+    page.wait_for("form", timeout=5)
+    page.type("first_name", data["first_name"], clear=True)
+    page.type("last_name", data["last_name"], clear=True)
+    page.type("email", data["email"], clear=True)
+    page.type("age", data["age"], clear=True)
+    page.type("salary", data["salary"], clear=True)
+    page.type("department", data["department"], clear=True)
+    submit_form(page)
 
 
 @when("I create 12 new records dynamically using random data")
 def step_create_bulk_records(context):
-    driver = context.driver
+    page = context.pages["web_tables"]
     context.bulk_user_emails = []
     for _ in range(12):
-        add_button = driver.find_element(By.ID, "addNewRecordButton")
-        scroll_into_view(driver, add_button)
-        add_button.click()
+        page.click("add_button")
 
-        record = build_random_record()
-        submit_registration_form(driver, record)
+        record = build_random_record(context)
+        submit_registration_form(page, record)
 
         context.bulk_user_emails.append(record["email"])
-        WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(
-                (By.XPATH, f"//div[@role='rowgroup']/div[@role='row'][.//div[text()='{record['email']}']]")
-            )
-        )
+        page.wait_for("row_by_email", EC.presence_of_element_located, timeout=5, email=record["email"])
+    context.table_index.invalidate()
+
+
+@when("I create {count:d} new records")
+def step_seed_records(context, count):
+    records = [build_random_record(context) for _ in range(count)]
+    seed_records(context.driver, records)
+    context.table_index.invalidate()
+    context.bulk_user_emails = [record["email"] for record in records]
+
+
+@then("all newly created records should be present in the table")
+def step_verify_records_present(context):
+    missing = context.table_index.missing(context.bulk_user_emails)
+    assert_that(missing).described_as("Seeded records missing from the table").is_empty()
 
 
 @when("I delete all newly created records")
 def step_delete_bulk_records(context):
-    driver = context.driver
-    for email in getattr(context, "bulk_user_emails", []):
+    page = context.pages["web_tables"]
+    for email in context.table_index.present(getattr(context, "bulk_user_emails", [])):
         try:
-            row = find_row_by_email(driver, email)
+            click_row_action(page, email, "delete_button")
         except TimeoutException:
             continue
-
-        delete_button = row.find_element(By.CSS_SELECTOR, "span[title='Delete']")
-        scroll_into_view(driver, delete_button)
-        delete_button.click()
-        WebDriverWait(driver, 5).until(
-            EC.invisibility_of_element_located((By.XPATH, f"//div[text()='{email}']"))
-        )
+        wait_for_row_removed(page, email)
+    context.table_index.invalidate()
 
 
 @then('the record should no longer be present in the table')
 def step_verify_record_deleted(context):
-    driver = context.driver
-    wait = WebDriverWait(driver, 5)
-    wait.until(EC.invisibility_of_element_located((By.XPATH, f"//div[text()='{context.user_email}']")))
-
-    try:
-        driver.find_element(By.XPATH, f"//div[text()='{context.user_email}']")
-        found = True
-    except NoSuchElementException:
-        found = False
-
-    assert_that(found).described_as("Primary record should be deleted").is_false()
-
-    for email in getattr(context, "bulk_user_emails", []):
-        try:
-            driver.find_element(By.XPATH, f"//div[text()='{email}']")
-            bulk_found = True
-        except NoSuchElementException:
-            bulk_found = False
+    page = context.pages["web_tables"]
+    WebDriverWait(context.driver, 5).until(
+        EC.invisibility_of_element_located(page.locator("cell", text=context.user_email))
+    )
 
-        assert_that(bulk_found).described_as(f"Bulk record with email {email} should be deleted").is_false()
+    table_index = context.table_index
+    assert_that(table_index.contains(context.user_email)).described_as("Primary record should be deleted").is_false()
 
+    remaining = table_index.present(getattr(context, "bulk_user_emails", []))
+    assert_that(remaining).described_as("Bulk records that should be deleted").is_empty()
@@ -11,3 +11,10 @@ Feature: Web Tables CRUD Operations
     And I delete all newly created records
     Then the record should no longer be present in the table
 
+
+  Scenario: Seed a large number of records in bulk
+    Given I navigate to the DemoQA homepage at "https://demoqa.com/"
+    When I click on the "Elements" card
+    And I click the "Web Tables" submenu item
+    And I create 500 new records
+    Then all newly created records should be present in the table
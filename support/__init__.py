@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Shared support code used by the Behave hooks and step definitions.
+
+"""
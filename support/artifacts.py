@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Keep a ring buffer of recent WebDriver commands and dump artifacts when a step fails.
+
+"""
+
+import json
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+
+
+RESOURCE_TIMINGS_SCRIPT = """
+return performance.getEntriesByType('resource').map((entry) => ({
+  name: entry.name,
+  type: entry.initiatorType,
+  start: Math.round(entry.startTime),
+  duration: Math.round(entry.duration),
+  size: entry.transferSize,
+  status: entry.responseStatus,
+}));
+"""
+PARAM_PREVIEW = 200
+
+
+def slugify(text):
+    return re.sub(r"[^A-Za-z0-9]+", "-", text).strip("-").lower()[:60] or "scenario"
+
+
+def describe_params(params):
+    text = json.dumps(params, default=str)
+    return text if len(text) <= PARAM_PREVIEW else text[:PARAM_PREVIEW] + "..."
+
+
+class FailureCapture:
+    """Record recent commands cheaply; only a failing step touches the browser or the disk."""
+
+    def __init__(self, output_dir="reports/failures", history=50):
+        self.output_dir = Path(output_dir)
+        self.commands = deque(maxlen=history)
+        self.scenario_started = 0.0
+        self.captured = []
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="failure-artifacts")
+        self._pending = []
+
+    def attach(self, driver):
+        executor = driver.command_executor
+        if getattr(executor, "_command_log", None) is self:
+            return driver
+        original_execute = executor.execute
+        commands = self.commands
+
+        def execute(command, params):
+            # The hot path is a single deque append; params are only formatted on failure.
+            commands.append((time.time(), command, params))
+            return original_execute(command, params)
+
+        executor.execute = execute
+        executor._command_log = self
+        return driver
+
+    def begin(self, scenario):
+        self.commands.clear()
+        self.scenario_started = time.time()
+
+    def _collect(self, driver):
+        # Everything that needs the browser happens here, before the scenario tears it down.
+        artifacts = {"commands": list(self.commands)}
+        collectors = {
+            "url": lambda: driver.current_url,
+            "title": lambda: driver.title,
+            "screenshot": driver.get_screenshot_as_png,
+            "page_source": lambda: driver.page_source,
+            "console": lambda: [
+                entry for entry in driver.get_log("browser")
+                if entry.get("timestamp", 0) >= self.scenario_started * 1000
+            ],
+            "network": lambda: driver.execute_script(RESOURCE_TIMINGS_SCRIPT),
+        }
+        for name, collect in collectors.items():
+            try:
+                artifacts[name] = collect()
+            except WebDriverException as error:
+                artifacts[name] = None
+                artifacts.setdefault("errors", {})[name] = error.msg or str(error)
+        return artifacts
+
+    def capture(self, driver, scenario, step):
+        line = getattr(step.location, "line", 0)
+        folder = self.output_dir / slugify(scenario.feature.name) / f"{slugify(scenario.name)}-line{line}"
+        meta = {
+            "feature": scenario.feature.name,
+            "scenario": scenario.name,
+            "step": f"{step.keyword} {step.name}",
+            "location": str(step.location),
+            "error": step.error_message,
+            "captured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        artifacts = self._collect(driver)
+        self._pending.append(self._writer.submit(self._write, folder, meta, artifacts))
+        self.captured.append(folder)
+        return folder
+
+    def _write(self, folder, meta, artifacts):
+        folder.mkdir(parents=True, exist_ok=True)
+        meta.update(url=artifacts.get("url"), title=artifacts.get("title"), errors=artifacts.get("errors", {}))
+        (folder / "failure.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        if artifacts.get("screenshot"):
+            (folder / "screenshot.png").write_bytes(artifacts["screenshot"])
+        if artifacts.get("page_source") is not None:
+            (folder / "page.html").write_text(artifacts["page_source"], encoding="utf-8")
+        if artifacts.get("console") is not None:
+            (folder / "console.json").write_text(json.dumps(artifacts["console"], indent=2), encoding="utf-8")
+        if artifacts.get("network") is not None:
+            (folder / "network.json").write_text(json.dumps(artifacts["network"], indent=2), encoding="utf-8")
+        started = artifacts["commands"][0][0] if artifacts["commands"] else 0.0
+        lines = [
+            f"+{timestamp - started:8.3f}s  {command}  {describe_params(params)}"
+            for timestamp, command, params in artifacts["commands"]
+        ]
+        (folder / "commands.log").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def close(self):
+        self._writer.shutdown(wait=True)
+        failures = [future.exception() for future in self._pending if future.exception() is not None]
+        return failures
+
+    def summary_lines(self, write_errors=()):
+        lines = [f"failures captured: {len(self.captured)}"]
+        lines.extend(f"  {folder}" for folder in self.captured)
+        lines.extend(f"  write failed: {error}" for error in write_errors)
+        return lines
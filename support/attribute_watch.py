@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Watch an element attribute inside the browser and react the moment it matches.
+
+"""
+
+from selenium.common.exceptions import TimeoutException
+
+from support.waits import script_timeout
+
+
+# `predicate` is a JavaScript expression evaluated with the attribute value bound
+# to `value`, e.g. "Number(value) > 15 && Number(value) < 25".
+WATCH_SCRIPT = """
+const selector = arguments[0];
+const attribute = arguments[1];
+const predicate = new Function('value', 'return (' + arguments[2] + ');');
+const clickSelector = arguments[3];
+const timeoutMs = arguments[4];
+const done = arguments[arguments.length - 1];
+
+const target = document.querySelector(selector);
+if (!target) {
+  done({ matched: false, error: 'no element matches ' + selector });
+  return;
+}
+
+let seen = 0;
+let finished = false;
+let observer = null;
+const finish = (result) => {
+  if (finished) {
+    return;
+  }
+  finished = true;
+  if (observer) {
+    observer.disconnect();
+  }
+  done(Object.assign({ valuesSeen: seen }, result));
+};
+
+const inspect = () => {
+  const value = target.getAttribute(attribute);
+  seen += 1;
+  if (!predicate(value)) {
+    return;
+  }
+  const matchedAt = performance.now();
+  if (clickSelector) {
+    document.querySelector(clickSelector).click();
+  }
+  finish({ matched: true, value: value, latencyMs: performance.now() - matchedAt });
+};
+
+observer = new MutationObserver(inspect);
+observer.observe(target, { attributes: true, attributeFilter: [attribute] });
+setTimeout(() => finish({ matched: false, value: target.getAttribute(attribute) }), timeoutMs);
+inspect();
+"""
+
+
+def wait_for_attribute(driver, css_selector, attribute, predicate, click_selector=None, timeout=30):
+    with script_timeout(driver, timeout + 5):
+        result = driver.execute_async_script(
+            WATCH_SCRIPT, css_selector, attribute, predicate, click_selector, int(timeout * 1000)
+        )
+    if not result.get("matched"):
+        reason = result.get("error") or f"last value {result.get('value')!r}"
+        raise TimeoutException(f"{css_selector}[{attribute}] never satisfied `{predicate}` ({reason})")
+    return {
+        "value": result["value"],
+        "values_seen": result["valuesSeen"],
+        "latency_ms": result["latencyMs"],
+    }
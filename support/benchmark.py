@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Benchmark features against a stored baseline and flag regressions.
+
+Usage:
+    python -m support.benchmark --runs 5 --save-baseline
+    python -m support.benchmark --runs 5 --threshold 15 features/sortable.feature:3
+
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+BASELINE_FILE = BASE_DIR / "benchmarks" / "baseline.json"
+RUNS_DIR = BASE_DIR / "reports" / "benchmark"
+METRICS = ("wall_time", "browser_start_time", "commands", "step_time")
+
+
+def discover_targets(paths):
+    targets = []
+    for path in paths:
+        candidate = BASE_DIR / path.split(":")[0]
+        if candidate.is_dir():
+            targets.extend(str(feature.relative_to(BASE_DIR)) for feature in sorted(candidate.rglob("*.feature")))
+        else:
+            targets.append(path)
+    return targets
+
+
+def run_once(target, run_index, site, extra_args):
+    report_file = RUNS_DIR / f"{target.replace('/', '_').replace(':', '_')}-{run_index}.json"
+    command = [
+        sys.executable, "-m", "behave", target,
+        "-f", "null",
+        "-D", "instrument=true",
+        "-D", f"instrument_report={report_file}",
+        "-D", f"site={site}",
+        *extra_args,
+    ]
+    started = time.perf_counter()
+    completed = subprocess.run(command, cwd=BASE_DIR, capture_output=True, text=True)
+    wall_time = time.perf_counter() - started
+    if completed.returncode != 0 or not report_file.exists():
+        raise RuntimeError(f"Benchmark run of {target} failed:\n{completed.stdout}\n{completed.stderr}")
+
+    data = json.loads(report_file.read_text(encoding="utf-8"))
+    totals = data["totals"]
+    return {
+        "wall_time": wall_time,
+        "browser_start_time": totals["browser_start_time"],
+        "commands": totals["commands"],
+        "step_time": totals["step_time"],
+        "webdriver_latency_ms": totals.get("webdriver_latency_ms"),
+        "channel_latency_ms": totals.get("channel_latency_ms"),
+        "steps": {f"{step['location']} {step['step']}": step["duration"] for step in data["steps"]},
+    }
+
+
+def summarise(runs):
+    summary = {metric: statistics.median(run[metric] for run in runs) for metric in METRICS}
+    step_names = runs[0]["steps"].keys()
+    summary["steps"] = {
+        name: statistics.median(run["steps"].get(name, 0.0) for run in runs) for name in step_names
+    }
+    for latency in ("webdriver_latency_ms", "channel_latency_ms"):
+        values = [run[latency] for run in runs if run[latency] is not None]
+        summary[latency] = statistics.median(values) if values else None
+    summary["runs"] = len(runs)
+    return summary
+
+
+def compare(target, current, baseline, threshold, min_step_seconds):
+    regressions = []
+    limit = 1 + threshold / 100
+
+    def check(label, now, before):
+        if before and now > before * limit:
+            regressions.append(f"{target} {label}: {before:.3f} -> {now:.3f} (+{(now / before - 1) * 100:.1f}%)")
+
+    for metric in METRICS:
+        check(metric, current[metric], baseline.get(metric))
+    for name, duration in current["steps"].items():
+        before = baseline.get("steps", {}).get(name)
+        if before is not None and before >= min_step_seconds:
+            check(name, duration, before)
+    return regressions
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    extra_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(
+        prog="python -m support.benchmark",
+        description="Benchmark features and compare them with a stored baseline.",
+    )
+    parser.add_argument("paths", nargs="*", default=["features"])
+    parser.add_argument("-n", "--runs", type=int, default=3)
+    parser.add_argument("--site", choices=("local", "remote"), default="local")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    parser.add_argument("--min-step-seconds", type=float, default=0.1,
+                        help="ignore steps faster than this in the baseline when comparing")
+    args = parser.parse_args(argv)
+
+    RUNS_DIR.mkdir(parents=True, exist_ok=True)
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+
+    results = {}
+    regressions = []
+    for target in discover_targets(args.paths):
+        runs = [run_once(target, index, args.site, extra_args) for index in range(args.runs)]
+        results[target] = summarise(runs)
+        current = results[target]
+        print(f"{target}: wall {current['wall_time']:.2f}s, browser start {current['browser_start_time']:.2f}s, "
+              f"steps {current['step_time']:.2f}s, {current['commands']:.0f} commands "
+              f"(median of {args.runs})")
+        latencies = [
+            f"{label} {current[latency]:.1f}ms"
+            for label, latency in (("WebDriver", "webdriver_latency_ms"), ("DevTools channel", "channel_latency_ms"))
+            if current[latency] is not None
+        ]
+        if latencies:
+            print(f"  mean command latency: {', '.join(latencies)}")
+        if target in baseline and not args.save_baseline:
+            regressions.extend(compare(target, current, baseline[target], args.threshold, args.min_step_seconds))
+
+    if args.save_baseline:
+        baseline.update(results)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    if regressions:
+        print(f"Regressions beyond {args.threshold:.0f}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Build Chrome WebDriver sessions for the hooks and standalone tools.
+- Apply the lean browser profile and record per-navigation load times.
+
+"""
+
+import json
+import statistics
+from pathlib import Path
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+
+from support.driver_resolver import get_resolver
+from support.profile_store import PROFILE_ROOT, ProfileStore
+
+
+# Ad, analytics and tag-manager hosts DemoQA pulls in on every page.
+THIRD_PARTY_BLOCKLIST = (
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*adservice.google.*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googletagservices.com*",
+    "*amazon-adsystem.com*",
+    "*adsafeprotected.com*",
+    "*moatads.com*",
+    "*pubmatic.com*",
+    "*rubiconproject.com*",
+    "*criteo.com*",
+    "*taboola.com*",
+    "*ezoic*",
+)
+# Headless Chrome otherwise starts at 800x600, which collapses DemoQA's layout.
+HEADLESS_WINDOW_SIZE = (1920, 1080)
+FONT_PATTERNS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*")
+
+
+class BrowserProfile:
+    """Launch settings shared by every Chrome session in a run."""
+
+    def __init__(self, headless=False, window_size=None, block_images=False, block_fonts=False,
+                 block_third_party=False, blocklist=(), profile_store=None):
+        self.headless = headless
+        self.window_size = window_size or (HEADLESS_WINDOW_SIZE if headless else None)
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.block_third_party = block_third_party
+        self.blocklist = tuple(blocklist)
+        self.profile_store = profile_store
+
+    @classmethod
+    def from_userdata(cls, userdata):
+        window_size = userdata.get("window_size", "")
+        return cls(
+            headless=userdata.getbool("headless", False),
+            window_size=tuple(int(part) for part in window_size.lower().split("x")) if window_size else None,
+            block_images=userdata.getbool("block_images", False),
+            block_fonts=userdata.getbool("block_fonts", False),
+            block_third_party=userdata.getbool("block_third_party", False),
+            blocklist=[pattern.strip() for pattern in userdata.get("blocklist", "").split(",") if pattern.strip()],
+            profile_store=ProfileStore(
+                root=userdata.get("profile_dir", "") or PROFILE_ROOT,
+                worker_id=userdata.get("worker_id"),
+            ) if userdata.getbool("persistent_profile", False) else None,
+        )
+
+    def blocked_urls(self):
+        patterns = list(self.blocklist)
+        if self.block_third_party:
+            patterns.extend(THIRD_PARTY_BLOCKLIST)
+        if self.block_fonts:
+            patterns.extend(FONT_PATTERNS)
+        return patterns
+
+    @property
+    def mode(self):
+        blocking = "blocking" if self.blocked_urls() or self.block_images else "unblocked"
+        return f"{blocking}, {'persistent' if self.profile_store else 'fresh'} profile"
+
+    def chrome_options(self, user_data_dir=None):
+        options = webdriver.ChromeOptions()
+        if user_data_dir is not None:
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.window_size:
+            options.add_argument("--window-size={},{}".format(*self.window_size))
+        # Console messages are buffered by chromedriver and only read when a step fails.
+        options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+        if self.block_images:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        return options
+
+    def apply(self, driver):
+        patterns = self.blocked_urls()
+        if patterns:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        if self.window_size:
+            driver.set_window_size(*self.window_size)
+        elif not self.headless:
+            driver.maximize_window()
+
+
+def create_driver(profile=None):
+    profile = profile or BrowserProfile()
+    service = Service(get_resolver().resolve())
+    store = profile.profile_store
+    user_data_dir = store.claim() if store is not None else None
+    try:
+        driver = webdriver.Chrome(service=service, options=profile.chrome_options(user_data_dir))
+    except WebDriverException:
+        if store is not None:
+            store.release(user_data_dir)
+        raise
+    if store is not None:
+        store.attach(driver, user_data_dir)
+    profile.apply(driver)
+    return driver
+
+
+# Waits for the load event, then reports the navigation timing entry of the current document.
+NAVIGATION_TIMING_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const collect = () => {
+  const entry = performance.getEntriesByType('navigation')[0];
+  const resources = performance.getEntriesByType('resource');
+  if (!entry) {
+    done(null);
+    return;
+  }
+  done({
+    origin: performance.timeOrigin,
+    url: location.href,
+    load: entry.loadEventEnd,
+    domContentLoaded: entry.domContentLoadedEventEnd,
+    resources: resources.length,
+    // transferSize 0 with a body means the disk or memory cache answered; cross-origin
+    // responses without Timing-Allow-Origin report zero sizes and cannot be classified.
+    cached: resources.filter((item) => item.transferSize === 0 && item.decodedBodySize > 0).length,
+    network: resources.filter((item) => item.transferSize > 0).length,
+  });
+};
+if (document.readyState === 'complete') {
+  setTimeout(collect, 0);
+} else {
+  window.addEventListener('load', () => setTimeout(collect, 0), { once: true });
+}
+"""
+
+
+class LoadTimes:
+    """Per-navigation load times, kept per profile mode so runs can be compared."""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.navigations = []
+        self._seen = set()
+
+    def record(self, driver):
+        try:
+            timing = driver.execute_async_script(NAVIGATION_TIMING_SCRIPT)
+        except WebDriverException:
+            return None
+        # In-app route changes keep the same document, so only new documents count.
+        if not timing or timing["origin"] in self._seen:
+            return None
+        self._seen.add(timing["origin"])
+        timing["path"] = urlparse(timing["url"]).path or "/"
+        self.navigations.append(timing)
+        return timing
+
+    def by_path(self):
+        paths = {}
+        for navigation in self.navigations:
+            paths.setdefault(navigation["path"], []).append(navigation["load"])
+        return paths
+
+    def cache_counts(self):
+        return {
+            "cached": sum(navigation.get("cached", 0) for navigation in self.navigations),
+            "network": sum(navigation.get("network", 0) for navigation in self.navigations),
+        }
+
+    def write(self, path):
+        # Each mode owns its own entry, so runs with different profiles end up side by side.
+        path = Path(path)
+        data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        data[self.mode] = {"paths": self.by_path(), "cache": self.cache_counts()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        return data
+
+    def summary_lines(self, data):
+        lines = [f"mode: {self.mode}, navigations recorded: {len(self.navigations)}"]
+        others = {mode: entry for mode, entry in data.items() if mode != self.mode and "paths" in entry}
+        for mode, entry in [(self.mode, data[self.mode])] + sorted(others.items()):
+            counts = entry["cache"]
+            classified = counts["cached"] + counts["network"]
+            if classified:
+                lines.append(f"  cache hit rate ({mode}): {counts['cached'] / classified:.0%} of {classified} resources")
+        for page_path, loads in sorted(self.by_path().items()):
+            line = f"  {page_path}: median load {statistics.median(loads):.0f}ms over {len(loads)}"
+            comparisons = [
+                f"{mode}: {statistics.median(entry['paths'][page_path]):.0f}ms"
+                for mode, entry in sorted(others.items()) if entry["paths"].get(page_path)
+            ]
+            if comparisons:
+                line += f" ({'; '.join(comparisons)})"
+            lines.append(line)
+        return lines
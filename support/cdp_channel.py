@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Keep a DevTools WebSocket open for element queries, script evaluation and events.
+
+"""
+
+import json
+import threading
+import time
+from urllib.request import urlopen
+
+import websocket
+
+
+# Resolves a WebDriver (strategy, value) locator in the page and reads one field from it.
+QUERY_FUNCTION = """
+(strategy, value, field, name, all) => {
+  const byXPath = (path) => {
+    const result = document.evaluate(path, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({ length: result.snapshotLength }, (_, index) => result.snapshotItem(index));
+  };
+  const finders = {
+    'css selector': (text) => Array.from(document.querySelectorAll(text)),
+    'id': (text) => Array.from(document.querySelectorAll('#' + CSS.escape(text))),
+    'class name': (text) => Array.from(document.getElementsByClassName(text)),
+    'tag name': (text) => Array.from(document.getElementsByTagName(text)),
+    'name': (text) => Array.from(document.getElementsByName(text)),
+    'xpath': byXPath,
+  };
+  const properties = ['value', 'checked', 'selected', 'disabled'];
+  const read = (element) => {
+    if (field === 'text') return element.innerText.trim();
+    if (field === 'displayed') {
+      const style = getComputedStyle(element);
+      return style.display !== 'none' && style.visibility !== 'hidden' && element.getClientRects().length > 0;
+    }
+    if (properties.includes(name) && name in element) {
+      const property = element[name];
+      return typeof property === 'boolean' ? (property ? 'true' : null) : String(property);
+    }
+    return element.getAttribute(name);
+  };
+  const elements = finders[strategy](value);
+  if (field === 'count') return elements.length;
+  if (all) return elements.map(read);
+  return elements.length ? { found: true, value: read(elements[0]) } : { found: false };
+}
+"""
+
+
+class ChannelError(Exception):
+    """The DevTools channel could not answer; callers fall back to WebDriver."""
+
+
+class CdpChannel:
+    """A persistent DevTools connection to the page the driver is focused on."""
+
+    def __init__(self, driver, recorder=None, timeout=10):
+        self.driver = driver
+        self.recorder = recorder
+        self.timeout = timeout
+        self.target_id = None
+        self.commands = 0
+        self.command_time = 0.0
+        self._socket = None
+        self._reader = None
+        self._next_id = 0
+        self._pending = {}
+        self._listeners = {}
+        self._lock = threading.Lock()
+        self._stale_target = False
+
+    # -- connection --------------------------------------------------------
+
+    def _debugger_address(self):
+        options = self.driver.capabilities.get("goog:chromeOptions", {})
+        address = options.get("debuggerAddress")
+        if not address:
+            raise ChannelError("Chrome did not expose a debugger address")
+        return address
+
+    def _page_target(self):
+        with urlopen(f"http://{self._debugger_address()}/json/list", timeout=self.timeout) as response:
+            targets = [target for target in json.load(response) if target.get("type") == "page"]
+        handle = self.driver.current_window_handle
+        for target in targets:
+            if target["id"] in handle:
+                return target
+        # Any other page would answer queries from the wrong window's DOM.
+        raise ChannelError(f"No page target matches window {handle}")
+
+    def connect(self):
+        self.close()
+        try:
+            target = self._page_target()
+        except (KeyError, OSError, ValueError) as error:
+            raise ChannelError(f"Could not find the DevTools target: {error}") from error
+        try:
+            # Chrome rejects DevTools sockets that send an Origin header it does not allow.
+            self._socket = websocket.create_connection(
+                target["webSocketDebuggerUrl"], timeout=self.timeout, suppress_origin=True
+            )
+        except (OSError, websocket.WebSocketException) as error:
+            raise ChannelError(f"Could not open the DevTools socket: {error}") from error
+        # The reader blocks between messages; only the handshake needed a timeout.
+        self._socket.settimeout(None)
+        self.target_id = target["id"]
+        self._stale_target = False
+        self._reader = threading.Thread(target=self._read_loop, args=(self._socket,), daemon=True)
+        self._reader.start()
+        for domain in {event.split(".")[0] for event in self._listeners}:
+            self.send(f"{domain}.enable")
+        return self
+
+    def close(self):
+        socket, self._socket = self._socket, None
+        if socket is not None:
+            try:
+                socket.close()
+            except (OSError, websocket.WebSocketException):
+                pass
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for slot in pending.values():
+            slot["error"] = "channel closed"
+            slot["event"].set()
+
+    def retarget(self):
+        # Window switches move WebDriver to another target; check lazily on the next call.
+        self._stale_target = True
+
+    def _ensure_target(self):
+        if self._socket is None:
+            self.connect()
+        elif self._stale_target:
+            if self.target_id in self.driver.current_window_handle:
+                self._stale_target = False
+            else:
+                self.connect()
+
+    def _read_loop(self, socket):
+        while True:
+            try:
+                message = json.loads(socket.recv())
+            except (OSError, ValueError, websocket.WebSocketException):
+                break
+            if "id" in message:
+                with self._lock:
+                    slot = self._pending.pop(message["id"], None)
+                if slot is not None:
+                    slot["message"] = message
+                    slot["event"].set()
+            else:
+                for callback in self._listeners.get(message.get("method"), ()):
+                    callback(message.get("params", {}))
+        # close() already failed the pending commands of a socket it shut down itself.
+        if socket is self._socket:
+            self._socket = None
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            for slot in pending.values():
+                slot["error"] = "DevTools socket closed"
+                slot["event"].set()
+
+    # -- commands ----------------------------------------------------------
+
+    def send(self, method, params=None):
+        self._ensure_target()
+        slot = {"event": threading.Event(), "message": None, "error": None}
+        with self._lock:
+            self._next_id += 1
+            command_id = self._next_id
+            self._pending[command_id] = slot
+        started = time.perf_counter()
+        try:
+            self._socket.send(json.dumps({"id": command_id, "method": method, "params": params or {}}))
+        except (AttributeError, OSError, websocket.WebSocketException) as error:
+            self._socket = None
+            raise ChannelError(f"{method} could not be sent: {error}") from error
+        if not slot["event"].wait(self.timeout):
+            with self._lock:
+                self._pending.pop(command_id, None)
+            raise ChannelError(f"{method} timed out after {self.timeout}s")
+        elapsed = time.perf_counter() - started
+        self.commands += 1
+        self.command_time += elapsed
+        if self.recorder is not None:
+            self.recorder(method, elapsed)
+        if slot["error"]:
+            raise ChannelError(f"{method} failed: {slot['error']}")
+        if "error" in slot["message"]:
+            raise ChannelError(f"{method} failed: {slot['message']['error'].get('message')}")
+        return slot["message"].get("result", {})
+
+    def subscribe(self, event, callback):
+        first = event not in self._listeners
+        self._listeners.setdefault(event, []).append(callback)
+        if first and self._socket is not None:
+            self.send(f"{event.split('.')[0]}.enable")
+
+    def evaluate(self, function, *args):
+        result = self.send("Runtime.evaluate", {
+            "expression": f"({function})(...{json.dumps(list(args))})",
+            "returnByValue": True,
+            "awaitPromise": True,
+        })
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise ChannelError(details.get("exception", {}).get("description") or details.get("text"))
+        return result.get("result", {}).get("value")
+
+    def query(self, locator, field, name=None):
+        strategy, value = locator
+        return self.evaluate(QUERY_FUNCTION, strategy, value, field, name, False)
+
+    def query_all(self, locator, field, name=None):
+        strategy, value = locator
+        return self.evaluate(QUERY_FUNCTION, strategy, value, field, name, True)
+
+
+def open_channel(driver, recorder=None):
+    try:
+        return CdpChannel(driver, recorder=recorder).connect()
+    except ChannelError:
+        return None
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Hand out seeded, pre-generated people records for the form and table steps.
+
+"""
+
+import json
+import random
+import re
+import zlib
+from pathlib import Path
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+CACHE_DIR = BASE_DIR / ".cache" / "test_data"
+POOL_SIZE = 1000
+# The pool is generated once from a fixed seed and cached; the run seed only picks from it.
+POOL_SEED = 20251019
+EMAIL_DOMAIN = "example.com"
+
+
+def new_seed():
+    return random.SystemRandom().randrange(1, 2 ** 31)
+
+
+def slug(text):
+    return re.sub(r"[^a-z]", "", text.lower()) or "user"
+
+
+def generate_pool(seed, size):
+    # Faker is only imported when there is no cached pool to load.
+    from faker import Faker
+
+    fake = Faker()
+    fake.seed_instance(seed)
+    return [
+        {
+            "first_name": fake.first_name(),
+            "last_name": fake.last_name(),
+            "phone": fake.numerify("##########"),
+            "address": fake.street_address(),
+            "age": str(fake.random_int(min=18, max=65)),
+            "salary": str(fake.random_int(min=30000, max=150000)),
+            "department": fake.job(),
+            "birth_year": fake.random_int(min=1990, max=2000),
+        }
+        for _ in range(size)
+    ]
+
+
+class RecordStream:
+    """Records for one scenario; the same run seed and key always yield the same records."""
+
+    def __init__(self, factory, key):
+        self.factory = factory
+        self.key = key
+        self.tag = format(zlib.crc32(key.encode("utf-8")), "08x")
+        self.random = random.Random(f"{factory.seed}:{key}")
+        self.issued = 0
+
+    def email(self, record, index):
+        # Sequence number plus scenario tag (and worker tag) make emails unique without
+        # Faker's ever-growing uniqueness set.
+        local_part = f"{slug(record['first_name'])}.{slug(record['last_name'])}.{self.tag}{index}"
+        if self.factory.worker_id is not None:
+            local_part += f".w{self.factory.worker_id}"
+        return f"{local_part}@{EMAIL_DOMAIN}"
+
+    def next(self):
+        pool = self.factory.pool
+        record = dict(pool[self.random.randrange(len(pool))])
+        record["email"] = self.email(record, self.issued)
+        self.issued += 1
+        return record
+
+    def take(self, count):
+        return [self.next() for _ in range(count)]
+
+
+class DataFactory:
+    """Seeded record streams drawn from a pre-generated pool cached on disk."""
+
+    def __init__(self, seed=None, worker_id=None, pool_size=POOL_SIZE, cache_dir=CACHE_DIR):
+        self.seed = seed if seed is not None else new_seed()
+        self.worker_id = worker_id
+        self.pool_size = pool_size
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.pool_source = None
+        self._pool = None
+        self._streams = []
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = self._load_pool()
+        return self._pool
+
+    def _load_pool(self):
+        cache_file = self.cache_dir / f"pool-{POOL_SEED}-{self.pool_size}.json" if self.cache_dir else None
+        if cache_file is not None and cache_file.exists():
+            try:
+                records = json.loads(cache_file.read_text(encoding="utf-8"))
+                self.pool_source = "cache"
+                return records
+            except (OSError, ValueError):
+                pass
+        records = generate_pool(POOL_SEED, self.pool_size)
+        self.pool_source = "generated"
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(records), encoding="utf-8")
+            except OSError:
+                pass
+        return records
+
+    def stream(self, key):
+        stream = RecordStream(self, key)
+        self._streams.append(stream)
+        return stream
+
+    def summary_lines(self):
+        issued = sum(stream.issued for stream in self._streams)
+        return [
+            f"seed: {self.seed} (reproduce with -D data_seed={self.seed})",
+            f"records issued: {issued} across {len(self._streams)} scenarios",
+            f"record pool: {self.pool_source or 'not needed'}",
+        ]
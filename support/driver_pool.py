@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Keep Chrome sessions alive across scenarios and reset their state between uses.
+
+"""
+
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+def reset_driver_state(driver, blank_url="about:blank"):
+    handles = driver.window_handles
+    primary_handle = handles[0]
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(primary_handle)
+
+    if driver.current_url.startswith("http"):
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    except (AttributeError, WebDriverException):
+        driver.delete_all_cookies()
+    driver.get(blank_url)
+
+
+class DriverPool:
+    """Hand out warm WebDriver sessions, launching new ones only when needed."""
+
+    def __init__(self, factory, size=1, recycle_after=0):
+        self.factory = factory
+        self.size = max(1, size)
+        self.recycle_after = recycle_after
+        self.launches = 0
+        self.acquisitions = 0
+        self.recycles = 0
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            self.acquisitions += 1
+            if self._idle:
+                return self._idle.pop()
+        driver = self.factory()
+        with self._lock:
+            self.launches += 1
+            self._uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver):
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+            expired = bool(self.recycle_after) and uses >= self.recycle_after
+            full = len(self._idle) >= self.size
+
+        if expired or full:
+            if expired:
+                self.recycles += 1
+            self.discard(driver)
+            return
+
+        try:
+            reset_driver_state(driver)
+        except WebDriverException:
+            self.discard(driver)
+            return
+
+        with self._lock:
+            self._idle.append(driver)
+
+    def discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self.discard(driver)
+
+    @property
+    def launches_saved(self):
+        return self.acquisitions - self.launches
+
+    def summary_lines(self):
+        return [
+            f"scenarios served: {self.acquisitions}",
+            f"browser launches: {self.launches}",
+            f"launches saved: {self.launches_saved}",
+            f"recycled sessions: {self.recycles}",
+        ]
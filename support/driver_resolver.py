@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Resolve the ChromeDriver binary once per process, preferring offline sources.
+
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+
+CACHE_FILE = Path.home() / ".cache" / "demoqa-bdd" / "chromedriver.json"
+
+
+class DriverResolutionError(RuntimeError):
+    pass
+
+
+def detect_chrome_major():
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        version = None
+    if not version:
+        return None
+    return version.split(".")[0]
+
+
+def binary_major(path):
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"(\d+)\.\d+", output)
+    return match.group(1) if match else None
+
+
+class ChromeDriverResolver:
+    """Find a ChromeDriver path once and remember it on disk per Chrome major version."""
+
+    def __init__(self, cache_file=CACHE_FILE, offline=False, driver_path=None):
+        self.cache_file = Path(cache_file)
+        self.offline = offline
+        self.driver_path = driver_path
+        self.path = None
+        self.source = None
+        self.chrome_major = None
+        self.resolution_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def resolve(self):
+        with self._lock:
+            if self.path is None:
+                started = time.perf_counter()
+                self.path, self.source = self._resolve()
+                self.resolution_seconds = time.perf_counter() - started
+            return self.path
+
+    def _resolve(self):
+        if self.driver_path:
+            return self.driver_path, "configured"
+
+        self.chrome_major = detect_chrome_major()
+        cache = self._load_cache()
+        key = self.chrome_major or "unknown"
+        cached_path = cache.get(key)
+        if cached_path and Path(cached_path).exists():
+            return cached_path, "disk cache"
+
+        system_path = shutil.which("chromedriver")
+        if system_path and (self.chrome_major is None or binary_major(system_path) == self.chrome_major):
+            self._store(cache, key, system_path)
+            return system_path, "system PATH"
+
+        if self.offline:
+            raise DriverResolutionError(
+                f"No cached or system chromedriver for Chrome {key} and offline mode is enabled"
+            )
+
+        downloaded_path = ChromeDriverManager().install()
+        self._store(cache, key, downloaded_path)
+        return downloaded_path, "webdriver-manager"
+
+    def _load_cache(self):
+        if not self.cache_file.exists():
+            return {}
+        try:
+            return json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+
+    def _store(self, cache, key, path):
+        cache[key] = path
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+
+    def summary_lines(self):
+        if self.path is None:
+            return ["chromedriver not resolved"]
+        return [
+            f"chromedriver: {self.path}",
+            f"source: {self.source} (Chrome major {self.chrome_major or 'unknown'})",
+            f"resolution time: {self.resolution_seconds * 1000:.0f} ms",
+        ]
+
+
+_default_resolver = None
+_default_lock = threading.Lock()
+
+
+def get_resolver(offline=False, driver_path=None):
+    global _default_resolver
+    with _default_lock:
+        if _default_resolver is None:
+            _default_resolver = ChromeDriverResolver(offline=offline, driver_path=driver_path)
+        return _default_resolver
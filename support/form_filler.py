@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Fill a whole form in one script call, falling back to per-field widgets.
+
+"""
+
+# Sets plain inputs through the native value setter so React notices the change,
+# toggles radios/checkboxes with a real click, and reports anything it skipped.
+FILL_SCRIPT = """
+const values = arguments[0];
+const unsupported = [];
+const setters = {
+  INPUT: Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set,
+  TEXTAREA: Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set,
+  SELECT: Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, 'value').set,
+};
+
+for (const [fieldId, value] of Object.entries(values)) {
+  const element = document.getElementById(fieldId);
+  const widget = element && (element.closest('.react-datepicker-wrapper')
+    || element.getAttribute('aria-autocomplete') || element.getAttribute('role') === 'combobox');
+  if (!element || !setters[element.tagName] || widget) {
+    unsupported.push(fieldId);
+    continue;
+  }
+  if (element.type === 'checkbox' || element.type === 'radio') {
+    if (element.checked !== Boolean(value)) {
+      element.click();
+    }
+    continue;
+  }
+  setters[element.tagName].call(element, String(value));
+  element.dispatchEvent(new Event('input', { bubbles: true }));
+  element.dispatchEvent(new Event('change', { bubbles: true }));
+}
+return unsupported;
+"""
+
+# Approximate WebDriver commands the per-field path spends on each kind of field.
+TEXT_FIELD_COMMANDS = 2
+TOGGLE_FIELD_COMMANDS = 3
+SCRIPTABLE_TYPES = (str, int, float, bool)
+
+
+def fill_form(driver, values, fallbacks=None):
+    fallbacks = fallbacks or {}
+    scriptable = {key: value for key, value in values.items() if isinstance(value, SCRIPTABLE_TYPES)}
+    unsupported = set(driver.execute_script(FILL_SCRIPT, scriptable)) if scriptable else set()
+    unsupported.update(key for key in values if key not in scriptable)
+
+    missing = sorted(key for key in unsupported if key not in fallbacks)
+    if missing:
+        raise ValueError(f"No fallback for form fields the script could not fill: {', '.join(missing)}")
+
+    scripted = [key for key in values if key not in unsupported]
+    for key, value in values.items():
+        if key in unsupported:
+            fallbacks[key](value)
+
+    per_field_cost = sum(
+        TOGGLE_FIELD_COMMANDS if isinstance(values[key], bool) else TEXT_FIELD_COMMANDS
+        for key in scripted
+    )
+    return {
+        "scripted": scripted,
+        "fallback": [key for key in values if key in unsupported],
+        "round_trips_saved": max(0, per_field_cost - (1 if scriptable else 0)),
+    }
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Record per-step wall time, WebDriver commands, explicit waits and sleeps.
+
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support import waits
+
+
+class Instrumentation:
+    """Collect timings for one run and write them out as a JSON report."""
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.perf_counter()
+        self.steps = []
+        self.commands = {}
+        self.hooks = {"commands": 0, "command_time": 0.0}
+        self.browser_starts = []
+        self.current = None
+        self._wait_depth = threading.local()
+        self._lock = threading.Lock()
+        self._originals = {}
+
+    # -- installation ------------------------------------------------------
+
+    def install(self):
+        recorder = self
+        original_until = WebDriverWait.until
+        original_until_not = WebDriverWait.until_not
+        original_browser_until = waits.WebDriverWait.until
+        original_sleep = time.sleep
+        self._originals = {
+            "until": original_until,
+            "until_not": original_until_not,
+            "browser_until": original_browser_until,
+            "sleep": original_sleep,
+        }
+
+        def timed_wait(method):
+            def wrapper(wait, *args, **kwargs):
+                depth = getattr(recorder._wait_depth, "value", 0)
+                recorder._wait_depth.value = depth + 1
+                started = time.perf_counter()
+                try:
+                    return method(wait, *args, **kwargs)
+                finally:
+                    recorder._wait_depth.value = depth
+                    if depth == 0:
+                        recorder._add("wait_time", time.perf_counter() - started)
+            return wrapper
+
+        def timed_sleep(seconds):
+            # WebDriverWait polls with time.sleep; that time is already counted as waiting.
+            if not getattr(recorder._wait_depth, "value", 0):
+                recorder._add("sleep_time", seconds)
+            original_sleep(seconds)
+
+        WebDriverWait.until = timed_wait(original_until)
+        WebDriverWait.until_not = timed_wait(original_until_not)
+        waits.WebDriverWait.until = timed_wait(original_browser_until)
+        time.sleep = timed_sleep
+
+    def uninstall(self):
+        if self._originals:
+            WebDriverWait.until = self._originals["until"]
+            WebDriverWait.until_not = self._originals["until_not"]
+            waits.WebDriverWait.until = self._originals["browser_until"]
+            time.sleep = self._originals["sleep"]
+            self._originals = {}
+
+    def wrap_driver(self, driver):
+        executor = driver.command_executor
+        if getattr(executor, "_instrumented", False):
+            return driver
+        original_execute = executor.execute
+        recorder = self
+
+        def execute(command, params):
+            started = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                recorder._record_command(command, time.perf_counter() - started)
+
+        executor.execute = execute
+        executor._instrumented = True
+        return driver
+
+    # -- recording ---------------------------------------------------------
+
+    def _add(self, field, value):
+        with self._lock:
+            if self.current is not None:
+                self.current[field] += value
+
+    def _record_command(self, command, elapsed):
+        with self._lock:
+            stats = self.commands.setdefault(command, {"count": 0, "total": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+            target = self.current if self.current is not None else self.hooks
+            target["commands"] += 1
+            target["command_time"] += elapsed
+
+    def record_channel_command(self, method, elapsed):
+        self._record_command(f"cdp:{method}", elapsed)
+
+    def record_browser_start(self, seconds, launched):
+        with self._lock:
+            self.browser_starts.append({"seconds": seconds, "launched": launched})
+
+    def start_step(self, feature, scenario, step):
+        with self._lock:
+            self.current = {
+                "feature": feature.name,
+                "scenario": scenario.name,
+                "step": f"{step.keyword} {step.name}",
+                "location": str(step.location),
+                "status": None,
+                "duration": 0.0,
+                "commands": 0,
+                "command_time": 0.0,
+                "wait_time": 0.0,
+                "sleep_time": 0.0,
+                "_started": time.perf_counter(),
+            }
+
+    def end_step(self, step):
+        with self._lock:
+            record, self.current = self.current, None
+        if record is None:
+            return
+        record["duration"] = time.perf_counter() - record.pop("_started")
+        record["status"] = step.status.name
+        self.steps.append(record)
+
+    # -- reporting ---------------------------------------------------------
+
+    def as_dict(self):
+        return {
+            "started_at": self.started_at.isoformat(),
+            "total_time": time.perf_counter() - self.started,
+            "totals": {
+                "steps": len(self.steps),
+                "step_time": sum(step["duration"] for step in self.steps),
+                "commands": sum(stats["count"] for stats in self.commands.values()),
+                "command_time": sum(stats["total"] for stats in self.commands.values()),
+                "wait_time": sum(step["wait_time"] for step in self.steps),
+                "sleep_time": sum(step["sleep_time"] for step in self.steps),
+                "hook_commands": self.hooks["commands"],
+                "hook_command_time": self.hooks["command_time"],
+                "webdriver_latency_ms": self._mean_latency(channel=False),
+                "channel_latency_ms": self._mean_latency(channel=True),
+                "browser_starts": sum(1 for start in self.browser_starts if start["launched"]),
+                "browser_start_time": sum(start["seconds"] for start in self.browser_starts),
+            },
+            "steps": self.steps,
+            "commands": self.commands,
+        }
+
+    def _mean_latency(self, channel):
+        stats = [value for command, value in self.commands.items() if command.startswith("cdp:") == channel]
+        count = sum(value["count"] for value in stats)
+        return sum(value["total"] for value in stats) / count * 1000 if count else None
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+        return path
+
+    def summary_lines(self, top=5):
+        data = self.as_dict()
+        totals = data["totals"]
+        lines = [
+            f"steps: {totals['steps']} in {totals['step_time']:.2f}s",
+            f"WebDriver commands: {totals['commands']} ({totals['command_time']:.2f}s), "
+            f"{totals['hook_commands']} of them outside steps",
+            f"explicit waits: {totals['wait_time']:.2f}s, sleeps: {totals['sleep_time']:.2f}s",
+            "mean command latency: " + ", ".join(
+                f"{label} {latency:.1f}ms" for label, latency in (
+                    ("WebDriver", totals["webdriver_latency_ms"]), ("DevTools channel", totals["channel_latency_ms"]),
+                ) if latency is not None
+            ),
+            f"browser start: {totals['browser_start_time']:.2f}s over {totals['browser_starts']} launches",
+            f"slowest {top} steps:",
+        ]
+        for step in sorted(self.steps, key=lambda item: item["duration"], reverse=True)[:top]:
+            lines.append(
+                f"  {step['duration']:7.2f}s  {step['commands']:5d} cmds  {step['step']}  ({step['location']})"
+            )
+        lines.append(f"most expensive {top} commands:")
+        ranked = sorted(self.commands.items(), key=lambda item: item[1]["total"], reverse=True)[:top]
+        for command, stats in ranked:
+            lines.append(f"  {stats['total']:7.2f}s  {stats['count']:5d}x  {command}")
+        return lines
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Drive one scenario's steps from many concurrent headless sessions and report latency.
+
+Usage:
+    python -m support.load --sessions 8 --duration 60
+    python -m support.load --sessions 4 --iterations 10 features/web_tables.feature:3
+
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+from behave.parser import parse_file
+from behave.runner_util import exec_file
+from behave.step_registry import registry
+from selenium.common.exceptions import WebDriverException
+
+from support.browser import BrowserProfile, create_driver
+from support.data_factory import DataFactory
+from support.driver_pool import reset_driver_state
+from support.local_site import LocalSite
+from support.pages import Pages
+from support.settle import SettleEngine
+from support.userdata import read_userdata
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+STEPS_DIR = BASE_DIR / "features" / "steps"
+DEFAULT_TARGET = "features/web_tables.feature:3"
+REPORT_FILE = BASE_DIR / "reports" / "load.json"
+# First match wins; step text decides which operation a step's latency counts towards.
+OPERATIONS = (
+    ("bulk_create", r"create \d+ new records"),
+    ("bulk_delete", r"delete all newly created"),
+    ("create", r"add a new record"),
+    ("edit", r"\bedit\b"),
+    ("delete", r"\bdelete\b"),
+    ("verify", r"\bshould\b"),
+    ("navigate", r"navigate|click on the|submenu"),
+)
+
+
+def operation_of(step_name):
+    for operation, pattern in OPERATIONS:
+        if re.search(pattern, step_name):
+            return operation
+    return "other"
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    # Nearest rank: the smallest sample with at least `fraction` of the samples at or below it.
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def latency_stats(samples, elapsed):
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "per_second": len(ordered) / elapsed if elapsed else 0.0,
+        "p50": percentile(ordered, 0.50),
+        "p95": percentile(ordered, 0.95),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
+
+
+def load_scenario(target):
+    path, _, line = target.partition(":")
+    feature = parse_file(str(BASE_DIR / path))
+    scenarios = list(feature.walk_scenarios())
+    if line:
+        scenarios = [scenario for scenario in scenarios if scenario.line == int(line)]
+    if not scenarios:
+        raise SystemExit(f"No scenario found at {target}")
+    return feature, scenarios[0]
+
+
+class SessionContext(SimpleNamespace):
+    """The parts of behave's Context that step definitions and Match.run rely on."""
+
+    def use_with_user_mode(self):
+        return contextlib.nullcontext()
+
+
+def load_step_definitions():
+    for step_file in sorted(STEPS_DIR.glob("*.py")):
+        exec_file(str(step_file), {})
+
+
+class LoadRun:
+    """Shared state and measurements for all sessions of one load run."""
+
+    def __init__(self, feature, scenario, userdata, site_url, duration, iterations, sessions=1):
+        self.feature = feature
+        self.scenario = scenario
+        self.userdata = userdata
+        self.site_url = site_url
+        self.duration = duration
+        self.iterations = iterations
+        self.started = None
+        self.deadline = None
+        # The measured window opens once every session has its browser up.
+        self._ready = threading.Barrier(sessions, action=self.start_clock)
+        self.profile = BrowserProfile.from_userdata(userdata)
+        self.data_factory = DataFactory(seed=int(userdata.get("data_seed") or 0) or None)
+        self.steps = {}
+        self.operations = {}
+        self.failures = {}
+        self.completed = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def start_clock(self):
+        self.started = time.monotonic()
+        self.deadline = self.started + self.duration
+
+    def more(self, iteration):
+        if self.iterations is not None:
+            return iteration < self.iterations
+        return time.monotonic() < self.deadline
+
+    def record_step(self, step, seconds, error=None):
+        name = f"{step.keyword} {step.name}"
+        with self._lock:
+            self.steps.setdefault(name, []).append(seconds)
+            self.operations.setdefault(operation_of(step.name), []).append(seconds)
+            if error is not None:
+                self.failures.setdefault(name, []).append(error)
+
+    def record_iteration(self, passed):
+        with self._lock:
+            if passed:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def session_context(self, driver, settle_engine):
+        return SessionContext(
+            config=SimpleNamespace(userdata=self.userdata),
+            feature=self.feature,
+            scenario=self.scenario,
+            driver=driver,
+            pages=Pages(driver),
+            site_url=self.site_url,
+            settle_engine=settle_engine,
+            skip_settle=False,
+        )
+
+    def run_iteration(self, context):
+        for step in self.scenario.steps:
+            match = registry.find_match(step)
+            started = time.perf_counter()
+            try:
+                if match is None:
+                    raise RuntimeError(f"No step definition for: {step.keyword} {step.name}")
+                match.run(context)
+                if context.settle_engine is not None and not context.skip_settle:
+                    context.settle_engine.settle(context.driver, step.name)
+                context.skip_settle = False
+            except Exception as error:
+                self.record_step(step, time.perf_counter() - started, f"{type(error).__name__}: {error}")
+                return False
+            self.record_step(step, time.perf_counter() - started)
+        return True
+
+    def run_session(self, session_id):
+        try:
+            driver = create_driver(self.profile)
+        except Exception:
+            self._ready.abort()
+            raise
+        settle_engine = None
+        if self.userdata.getbool("settle", True):
+            settle_engine = SettleEngine(
+                quiet_ms=self.userdata.getint("settle_quiet_ms", 150),
+                timeout_ms=self.userdata.getint("settle_timeout_ms", 1000),
+            )
+        iteration = 0
+        try:
+            self._ready.wait()
+            while self.more(iteration):
+                context = self.session_context(driver, settle_engine)
+                context.data = self.data_factory.stream(f"load:{session_id}:{iteration}")
+                self.record_iteration(self.run_iteration(context))
+                iteration += 1
+                try:
+                    reset_driver_state(driver)
+                except WebDriverException:
+                    driver.quit()
+                    driver = create_driver(self.profile)
+        finally:
+            driver.quit()
+        return iteration
+
+    def report(self, elapsed, sessions):
+        return {
+            "scenario": self.scenario.name,
+            "sessions": sessions,
+            "elapsed": elapsed,
+            "iterations": {"passed": self.completed, "failed": self.failed},
+            "throughput": {
+                "iterations_per_second": (self.completed + self.failed) / elapsed if elapsed else 0.0,
+                "steps_per_second": sum(len(samples) for samples in self.steps.values()) / elapsed if elapsed else 0.0,
+            },
+            "steps": {name: latency_stats(samples, elapsed) for name, samples in self.steps.items()},
+            "operations": {name: latency_stats(samples, elapsed) for name, samples in self.operations.items()},
+            "failures": {name: errors[:5] for name, errors in self.failures.items()},
+        }
+
+
+def print_table(title, rows):
+    print(title)
+    print(f"  {'count':>6} {'per s':>7} {'p50':>8} {'p95':>8} {'p99':>8}  name")
+    for name, stats in rows.items():
+        print(f"  {stats['count']:6d} {stats['per_second']:7.2f} {stats['p50']:7.2f}s "
+              f"{stats['p95']:7.2f}s {stats['p99']:7.2f}s  {name}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m support.load",
+        description="Run one scenario from many concurrent headless sessions against the local replica.",
+    )
+    parser.add_argument("target", nargs="?", default=DEFAULT_TARGET, help="feature file, optionally with :line")
+    parser.add_argument("-s", "--sessions", type=int, default=4)
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument("-d", "--duration", type=float, default=60.0, help="seconds to keep starting iterations")
+    limit.add_argument("-n", "--iterations", type=int, help="iterations per session instead of a duration")
+    parser.add_argument("-D", "--define", action="append", default=[], help="behave userdata override")
+    parser.add_argument("--report", default=str(REPORT_FILE))
+    args = parser.parse_args(argv)
+
+    # Load runs always target the local replica with headless browsers.
+    userdata = read_userdata(args.define, site="local", headless="true")
+    feature, scenario = load_scenario(args.target)
+    load_step_definitions()
+
+    site = LocalSite()
+    site_url = site.start()
+    run = LoadRun(feature, scenario, userdata, site_url, args.duration, args.iterations, args.sessions)
+    run.data_factory.pool  # Build or load the record pool once, before the sessions race for it.
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.sessions) as executor:
+            list(executor.map(run.run_session, range(args.sessions)))
+    finally:
+        site.stop()
+    elapsed = time.monotonic() - run.started
+
+    result = run.report(elapsed, args.sessions)
+    report_path = Path(args.report)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    iterations = result["iterations"]
+    print(f"{scenario.name}: {args.sessions} sessions, {elapsed:.1f}s, "
+          f"{iterations['passed']} passed / {iterations['failed']} failed iterations, "
+          f"{result['throughput']['iterations_per_second']:.2f} iterations/s")
+    print_table("Per step:", result["steps"])
+    print_table("Per operation:", result["operations"])
+    for name, errors in result["failures"].items():
+        print(f"Failures in {name}: {len(run.failures[name])}, e.g. {errors[0]}")
+    print(f"Report written to {report_path}")
+    return 1 if iterations["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Offline replica of the DemoQA pages exercised by the features.
+
+"""
+
+from support.local_site.server import LocalSite
+
+__all__ = ["LocalSite"]
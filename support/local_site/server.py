@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Serve the bundled DemoQA replica from a threaded local HTTP server.
+
+Usage:
+    python -m support.local_site.server [--port 8000]
+
+"""
+
+import argparse
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+ROUTES = {
+    "/": "index.html",
+    "/elements": "group.html",
+    "/forms": "group.html",
+    "/alertsWindows": "group.html",
+    "/widgets": "group.html",
+    "/interaction": "group.html",
+    "/webtables": "webtables.html",
+    "/automation-practice-form": "practice-form.html",
+    "/progress-bar": "progress-bar.html",
+    "/sortable": "sortable.html",
+    "/browser-windows": "browser-windows.html",
+    "/sample": "sample.html",
+}
+
+
+class SiteRequestHandler(SimpleHTTPRequestHandler):
+    def translate_path(self, path):
+        route = urlsplit(path).path.rstrip("/") or "/"
+        if route in ROUTES:
+            path = "/" + ROUTES[route]
+        return super().translate_path(path)
+
+    def end_headers(self):
+        # Revalidate on every use: persistent profiles would otherwise keep serving an old
+        # replica, and unchanged files still come back as a cheap 304 via Last-Modified.
+        self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSite:
+    """Run the replica on a background thread for the lifetime of a test run."""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        handler = partial(SiteRequestHandler, directory=str(STATIC_DIR))
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="local-site", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the local DemoQA replica.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    site = LocalSite(args.host, args.port)
+    print(f"Serving the DemoQA replica at {site.url}")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,489 @@
+(function () {
+  'use strict';
+
+  const MENU = [
+    {
+      group: 'Elements',
+      path: 'elements',
+      items: [['Text Box', null], ['Check Box', null], ['Radio Button', null], ['Web Tables', 'webtables'], ['Buttons', null]],
+    },
+    { group: 'Forms', path: 'forms', items: [['Practice Form', 'automation-practice-form']] },
+    {
+      group: 'Alerts, Frame & Windows',
+      path: 'alertsWindows',
+      items: [['Browser Windows', 'browser-windows'], ['Alerts', null], ['Frames', null]],
+    },
+    { group: 'Widgets', path: 'widgets', items: [['Accordian', null], ['Progress Bar', 'progress-bar'], ['Slider', null]] },
+    { group: 'Interactions', path: 'interaction', items: [['Sortable', 'sortable'], ['Selectable', null]] },
+  ];
+
+  function el(tag, attrs, children) {
+    const node = document.createElement(tag);
+    Object.entries(attrs || {}).forEach(([name, value]) => node.setAttribute(name, value));
+    (children || []).forEach((child) => {
+      node.appendChild(typeof child === 'string' ? document.createTextNode(child) : child);
+    });
+    return node;
+  }
+
+  function go(path) {
+    window.location.href = '/' + path;
+  }
+
+  function renderMenu() {
+    const container = document.getElementById('menu');
+    if (!container) {
+      return;
+    }
+    MENU.forEach((group) => {
+      const list = el('ul', { class: 'menu-list' });
+      group.items.forEach(([label, path]) => {
+        const item = el('li', { class: 'btn btn-light' }, [el('span', { class: 'text' }, [label])]);
+        if (path) {
+          item.addEventListener('click', () => go(path));
+        }
+        list.appendChild(item);
+      });
+      container.append(el('div', { class: 'group-header' }, [group.group]), list);
+    });
+  }
+
+  function initHome() {
+    const cards = document.getElementById('cards');
+    MENU.forEach((group) => {
+      const card = el('div', { class: 'card mt-4 top-card' }, [
+        el('div', { class: 'card-body' }, [el('h5', {}, [group.group])]),
+      ]);
+      card.addEventListener('click', () => go(group.path));
+      cards.appendChild(card);
+    });
+  }
+
+  function showModal(content) {
+    const backdrop = el('div', { class: 'modal-backdrop fade show' }, [
+      el('div', { class: 'modal-dialog modal-lg', role: 'dialog' }, [content]),
+    ]);
+    document.body.appendChild(backdrop);
+    return () => backdrop.remove();
+  }
+
+  /* ---- Practice Form ------------------------------------------------- */
+
+  const MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September',
+    'October', 'November', 'December'];
+  const SUBJECTS = ['Maths', 'Physics', 'Chemistry', 'Biology', 'English', 'Hindi', 'History', 'Economics',
+    'Computer Science', 'Commerce', 'Accounting', 'Arts', 'Civics', 'Social Studies'];
+  const CITIES = {
+    NCR: ['Delhi', 'Gurgaon', 'Noida'],
+    'Uttar Pradesh': ['Agra', 'Lucknow', 'Merrut'],
+    Haryana: ['Karnal', 'Panipat'],
+    Rajasthan: ['Jaipur', 'Jaiselmer'],
+  };
+
+  function formatDate(date) {
+    const day = String(date.getDate()).padStart(2, '0');
+    return `${day} ${MONTHS[date.getMonth()].slice(0, 3)} ${date.getFullYear()}`;
+  }
+
+  function initDatePicker(input) {
+    const wrapper = input.closest('.react-datepicker-wrapper');
+    let selected = new Date();
+    let popup = null;
+    input.value = formatDate(selected);
+
+    function close() {
+      if (popup) {
+        popup.remove();
+        popup = null;
+      }
+    }
+
+    function render(viewYear, viewMonth) {
+      close();
+      const monthSelect = el('select', { class: 'react-datepicker__month-select' },
+        MONTHS.map((name, index) => el('option', { value: String(index) }, [name])));
+      const yearSelect = el('select', { class: 'react-datepicker__year-select' });
+      for (let year = 1900; year <= 2100; year += 1) {
+        yearSelect.appendChild(el('option', { value: String(year) }, [String(year)]));
+      }
+      monthSelect.value = String(viewMonth);
+      yearSelect.value = String(viewYear);
+      const rerender = () => render(Number(yearSelect.value), Number(monthSelect.value));
+      monthSelect.addEventListener('change', rerender);
+      yearSelect.addEventListener('change', rerender);
+
+      const grid = el('div', { class: 'react-datepicker__month' });
+      const first = new Date(viewYear, viewMonth, 1);
+      const start = new Date(viewYear, viewMonth, 1 - first.getDay());
+      for (let offset = 0; offset < 42; offset += 1) {
+        const date = new Date(start.getFullYear(), start.getMonth(), start.getDate() + offset);
+        const classes = ['react-datepicker__day', `react-datepicker__day--0${String(date.getDate()).padStart(2, '0')}`];
+        if (date.getMonth() !== viewMonth) {
+          classes.push('react-datepicker__day--outside-month');
+        }
+        const day = el('div', { class: classes.join(' '), role: 'option' }, [String(date.getDate())]);
+        day.addEventListener('click', () => {
+          selected = date;
+          input.value = formatDate(date);
+          close();
+        });
+        grid.appendChild(day);
+      }
+      popup = el('div', { class: 'react-datepicker' }, [monthSelect, yearSelect, grid]);
+      wrapper.appendChild(popup);
+    }
+
+    input.addEventListener('click', () => {
+      if (!popup) {
+        render(selected.getFullYear(), selected.getMonth());
+      }
+    });
+  }
+
+  function initSubjects(input) {
+    const chips = document.getElementById('subjectsChips');
+    input.addEventListener('keydown', (event) => {
+      if (event.key !== 'Enter') {
+        return;
+      }
+      event.preventDefault();
+      const typed = input.value.trim().toLowerCase();
+      const match = SUBJECTS.find((subject) => typed && subject.toLowerCase().startsWith(typed));
+      if (match) {
+        chips.appendChild(el('span', { class: 'subject-chip' }, [match]));
+        input.value = '';
+      }
+    });
+  }
+
+  function initSelect(container, getOptions, onChange) {
+    let menu = null;
+    let value = '';
+    const label = el('div', { class: 'select-value' }, [container.dataset.placeholder]);
+    container.appendChild(label);
+
+    container.addEventListener('click', (event) => {
+      if (menu) {
+        if (!menu.contains(event.target)) {
+          menu.remove();
+          menu = null;
+        }
+        return;
+      }
+      const options = getOptions();
+      if (!options.length) {
+        return;
+      }
+      menu = el('div', { class: 'select-menu' });
+      options.forEach((option, index) => {
+        const item = el('div', { id: `react-select-${container.dataset.selectId}-option-${index}` }, [option]);
+        item.addEventListener('click', (clickEvent) => {
+          clickEvent.stopPropagation();
+          value = option;
+          label.textContent = option;
+          menu.remove();
+          menu = null;
+          onChange(option);
+        });
+        menu.appendChild(item);
+      });
+      container.appendChild(menu);
+    });
+
+    return {
+      get value() {
+        return value;
+      },
+      reset() {
+        value = '';
+        label.textContent = container.dataset.placeholder;
+      },
+    };
+  }
+
+  function initPracticeForm() {
+    const form = document.getElementById('userForm');
+    const field = (id) => document.getElementById(id);
+    initDatePicker(field('dateOfBirthInput'));
+    initSubjects(field('subjectsInput'));
+
+    let city = null;
+    const state = initSelect(field('state'), () => Object.keys(CITIES), () => city.reset());
+    city = initSelect(field('city'), () => CITIES[state.value] || [], () => {});
+
+    form.addEventListener('submit', (event) => {
+      event.preventDefault();
+      form.classList.add('was-validated');
+      const gender = form.querySelector("input[name='gender']:checked");
+      const mobileValid = /^\d{10}$/.test(field('userNumber').value);
+      if (!field('firstName').value || !field('lastName').value || !gender || !mobileValid) {
+        return;
+      }
+      const checked = (selector) => Array.from(form.querySelectorAll(selector)).map((input) => input.value);
+      const upload = field('uploadPicture').files[0];
+      const rows = [
+        ['Student Name', `${field('firstName').value} ${field('lastName').value}`],
+        ['Student Email', field('userEmail').value],
+        ['Gender', gender.value],
+        ['Mobile', field('userNumber').value],
+        ['Date of Birth', field('dateOfBirthInput').value],
+        ['Subjects', Array.from(document.querySelectorAll('.subject-chip')).map((chip) => chip.textContent).join(', ')],
+        ['Hobbies', checked("input[type='checkbox']:checked").join(', ')],
+        ['Picture', upload ? upload.name : ''],
+        ['Address', field('currentAddress').value],
+        ['State and City', `${state.value} ${city.value}`.trim()],
+      ];
+      const closeButton = el('button', { id: 'closeLargeModal', type: 'button' }, ['Close']);
+      const close = showModal(el('div', { class: 'modal-content' }, [
+        el('div', { class: 'modal-header' }, [
+          el('div', { id: 'example-modal-sizes-title-lg', class: 'modal-title h4' }, ['Thanks for submitting the form']),
+        ]),
+        el('table', { class: 'table' }, rows.map(([name, value]) => el('tr', {}, [
+          el('td', {}, [name]), el('td', {}, [value]),
+        ]))),
+        closeButton,
+      ]));
+      closeButton.addEventListener('click', () => {
+        close();
+        form.reset();
+        form.classList.remove('was-validated');
+        document.getElementById('subjectsChips').innerHTML = '';
+        state.reset();
+        city.reset();
+      });
+    });
+  }
+
+  /* ---- Web Tables ---------------------------------------------------- */
+
+  const COLUMNS = [
+    ['First Name', 'firstName'],
+    ['Last Name', 'lastName'],
+    ['Age', 'age'],
+    ['Email', 'email'],
+    ['Salary', 'salary'],
+    ['Department', 'department'],
+  ];
+  const EMAIL_PATTERN = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+  function initWebTables() {
+    const records = [
+      { id: 1, firstName: 'Cierra', lastName: 'Vega', age: '39', email: 'cierra@example.com', salary: '10000', department: 'Insurance' },
+      { id: 2, firstName: 'Alden', lastName: 'Cantrell', age: '45', email: 'alden@example.com', salary: '12000', department: 'Compliance' },
+      { id: 3, firstName: 'Kierra', lastName: 'Gentry', age: '29', email: 'kierra@example.com', salary: '2000', department: 'Legal' },
+    ];
+    let nextId = 4;
+    let page = 0;
+    const pageSizeSelect = document.querySelector("select[aria-label='rows per page']");
+    const previous = document.querySelector('.-previous button');
+    const next = document.querySelector('.-next button');
+    const search = document.getElementById('searchBox');
+    const head = document.querySelector('.rt-thead');
+    const body = document.querySelector('.rt-tbody');
+
+    head.appendChild(el('div', { class: 'rt-tr', role: 'row' },
+      COLUMNS.map(([label]) => el('div', { class: 'rt-th', role: 'columnheader' }, [label]))
+        .concat([el('div', { class: 'rt-th', role: 'columnheader' }, ['Action'])])));
+
+    function visibleRecords() {
+      const term = search.value.trim().toLowerCase();
+      if (!term) {
+        return records;
+      }
+      return records.filter((record) => COLUMNS.some(([, key]) => String(record[key]).toLowerCase().includes(term)));
+    }
+
+    function render() {
+      const pageSize = Number(pageSizeSelect.value);
+      const rows = visibleRecords();
+      const totalPages = Math.max(1, Math.ceil(rows.length / pageSize));
+      page = Math.min(page, totalPages - 1);
+      const slice = rows.slice(page * pageSize, (page + 1) * pageSize);
+      const groups = [];
+      for (let index = 0; index < pageSize; index += 1) {
+        const record = slice[index];
+        let cells;
+        if (record) {
+          const edit = el('span', { title: 'Edit', id: `edit-record-${record.id}` });
+          const remove = el('span', { title: 'Delete', id: `delete-record-${record.id}` });
+          edit.addEventListener('click', () => openForm(record));
+          remove.addEventListener('click', () => {
+            records.splice(records.indexOf(record), 1);
+            render();
+          });
+          cells = COLUMNS.map(([, key]) => el('div', { class: 'rt-td', role: 'gridcell' }, [String(record[key])]))
+            .concat([el('div', { class: 'rt-td', role: 'gridcell' }, [el('div', { class: 'action-buttons' }, [edit, remove])])]);
+        } else {
+          cells = COLUMNS.concat([[]]).map(() => el('div', { class: 'rt-td', role: 'gridcell' }));
+        }
+        const rowClass = record ? 'rt-tr' : 'rt-tr -padRow';
+        groups.push(el('div', { class: 'rt-tr-group', role: 'rowgroup' }, [el('div', { class: rowClass, role: 'row' }, cells)]));
+      }
+      body.replaceChildren(...groups);
+      document.querySelector('.-currentPage').textContent = String(page + 1);
+      document.querySelector('.-totalPages').textContent = String(totalPages);
+      previous.disabled = page === 0;
+      next.disabled = page >= totalPages - 1;
+    }
+
+    function openForm(record) {
+      const inputs = {};
+      const rows = COLUMNS.map(([label, key]) => {
+        const id = key === 'email' ? 'userEmail' : key;
+        inputs[key] = el('input', { id: id, type: 'text', placeholder: label });
+        inputs[key].value = record ? record[key] : '';
+        return el('div', { class: 'form-row' }, [el('label', {}, [label]), inputs[key]]);
+      });
+      const form = el('form', { id: 'userForm', novalidate: '' },
+        rows.concat([el('button', { id: 'submit', type: 'submit' }, ['Submit'])]));
+      const close = showModal(el('div', { class: 'modal-content' }, [
+        el('div', { id: 'registration-form-modal', class: 'modal-title h4' }, ['Registration Form']),
+        form,
+      ]));
+      form.addEventListener('submit', (event) => {
+        event.preventDefault();
+        const values = {};
+        COLUMNS.forEach(([, key]) => { values[key] = inputs[key].value.trim(); });
+        const valid = COLUMNS.every(([, key]) => values[key])
+          && EMAIL_PATTERN.test(values.email) && /^\d+$/.test(values.age) && /^\d+$/.test(values.salary);
+        if (!valid) {
+          form.classList.add('was-validated');
+          return;
+        }
+        if (record) {
+          Object.assign(record, values);
+        } else {
+          records.push(Object.assign({ id: nextId }, values));
+          nextId += 1;
+        }
+        close();
+        render();
+      });
+    }
+
+    document.getElementById('addNewRecordButton').addEventListener('click', () => openForm(null));
+    pageSizeSelect.addEventListener('change', () => { page = 0; render(); });
+    search.addEventListener('input', () => { page = 0; render(); });
+    previous.addEventListener('click', () => { page = Math.max(0, page - 1); render(); });
+    next.addEventListener('click', () => { page += 1; render(); });
+    render();
+  }
+
+  /* ---- Progress Bar -------------------------------------------------- */
+
+  function initProgressBar() {
+    const bar = document.querySelector("div[role='progressbar']");
+    const buttons = document.getElementById('progressButtons');
+    let value = 0;
+    let timer = null;
+
+    function setValue(next) {
+      value = next;
+      bar.setAttribute('aria-valuenow', String(value));
+      bar.style.width = `${value}%`;
+      bar.textContent = `${value}%`;
+      bar.classList.toggle('bg-success', value >= 100);
+      bar.classList.toggle('bg-info', value < 100);
+    }
+
+    function showStartButton() {
+      const button = el('button', { id: 'startStopButton' }, ['Start']);
+      button.addEventListener('click', () => {
+        if (timer) {
+          clearInterval(timer);
+          timer = null;
+          button.textContent = 'Start';
+          return;
+        }
+        button.textContent = 'Stop';
+        timer = setInterval(() => {
+          setValue(value + 1);
+          if (value >= 100) {
+            clearInterval(timer);
+            timer = null;
+            showResetButton();
+          }
+        }, 50);
+      });
+      buttons.replaceChildren(button);
+    }
+
+    function showResetButton() {
+      const button = el('button', { id: 'resetButton' }, ['Reset']);
+      button.addEventListener('click', () => {
+        setValue(0);
+        showStartButton();
+      });
+      buttons.replaceChildren(button);
+    }
+
+    showStartButton();
+  }
+
+  /* ---- Sortable ------------------------------------------------------ */
+
+  function initSortableContainer(container, labels) {
+    labels.forEach((label) => {
+      container.appendChild(el('div', { class: 'list-group-item list-group-item-action' }, [label]));
+    });
+    let dragged = null;
+    container.addEventListener('mousedown', (event) => {
+      dragged = event.target.closest('.list-group-item');
+    });
+    document.addEventListener('mouseup', (event) => {
+      if (!dragged) {
+        return;
+      }
+      const source = dragged;
+      dragged = null;
+      const hit = document.elementFromPoint(event.clientX, event.clientY);
+      const target = hit && hit.closest('.list-group-item');
+      if (!target || target === source || target.parentElement !== container) {
+        return;
+      }
+      const items = Array.from(container.children);
+      const before = items.indexOf(source) > items.indexOf(target) ? target : target.nextSibling;
+      container.insertBefore(source, before);
+    });
+  }
+
+  function initSortable() {
+    document.querySelectorAll('.nav-tabs a').forEach((tab) => {
+      tab.addEventListener('click', () => {
+        document.querySelectorAll('.nav-tabs a').forEach((other) => other.classList.toggle('active', other === tab));
+        document.querySelectorAll('.tab-pane').forEach((pane) => {
+          pane.classList.toggle('active', pane.id === tab.dataset.pane);
+        });
+      });
+    });
+    initSortableContainer(document.querySelector('#demo-tabpane-list .vertical-list-container'),
+      ['One', 'Two', 'Three', 'Four', 'Five', 'Six']);
+    initSortableContainer(document.querySelector('#demo-tabpane-grid .create-grid'),
+      ['One', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight', 'Nine']);
+  }
+
+  /* ---- Browser Windows ----------------------------------------------- */
+
+  function initBrowserWindows() {
+    document.getElementById('tabButton').addEventListener('click', () => window.open('/sample', '_blank'));
+    document.getElementById('windowButton').addEventListener('click', () => {
+      window.open('/sample', '_blank', 'width=800,height=600');
+    });
+    document.getElementById('messageWindowButton').addEventListener('click', () => {
+      const popup = window.open('', '_blank', 'width=400,height=200');
+      popup.document.body.textContent = 'Knowledge increases by sharing but not by saving.';
+    });
+  }
+
+  const PAGES = {
+    home: initHome,
+    'practice-form': initPracticeForm,
+    webtables: initWebTables,
+    'progress-bar': initProgressBar,
+    sortable: initSortable,
+    'browser-windows': initBrowserWindows,
+  };
+
+  renderMenu();
+  (PAGES[document.body.dataset.page] || (() => {}))();
+}());
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Route card/submenu navigation either through clicks or straight to the target URL.
+
+"""
+
+from urllib.parse import urljoin
+
+from support import waits as EC
+
+
+ROUTES = {
+    ("Forms", "Practice Form"): "automation-practice-form",
+    ("Elements", "Web Tables"): "webtables",
+    ("Widgets", "Progress Bar"): "progress-bar",
+    ("Interactions", "Sortable"): "sortable",
+    ("Alerts, Frame & Windows", "Browser Windows"): "browser-windows",
+}
+DEFAULT_BASE_URL = "https://demoqa.com/"
+CLICK_NAVIGATION_TAG = "click_navigation"
+
+
+def deep_linking(context):
+    if CLICK_NAVIGATION_TAG in context.scenario.effective_tags:
+        return False
+    return context.config.userdata.get("navigation", "deep_link") == "deep_link"
+
+
+def resolve_url(context, url):
+    # With the local replica running, DemoQA URLs are redirected to it.
+    site_url = getattr(context, "site_url", None)
+    if site_url and url.startswith(DEFAULT_BASE_URL):
+        return urljoin(site_url, url[len(DEFAULT_BASE_URL):])
+    return url
+
+
+def click_card(context, card_name):
+    context.pages["home"].click("card", name=card_name)
+    context.pages.navigated()
+
+
+def click_submenu(context, submenu_name):
+    menu = context.pages["menu"]
+    menu.wait_for("submenu", EC.element_to_be_clickable, name=submenu_name)
+    menu.click("submenu", name=submenu_name)
+    context.pages.navigated()
+
+
+def open_homepage(context, url=DEFAULT_BASE_URL):
+    context.base_url = resolve_url(context, url)
+    context.homepage_loaded = not deep_linking(context)
+    if context.homepage_loaded:
+        context.driver.get(context.base_url)
+        context.pages.navigated()
+
+
+def open_card(context, card_name):
+    context.selected_card = card_name
+    if context.homepage_loaded:
+        click_card(context, card_name)
+
+
+def open_submenu(context, submenu_name):
+    route = ROUTES.get((context.selected_card, submenu_name))
+    if not context.homepage_loaded:
+        if route is not None:
+            context.driver.get(urljoin(context.base_url, route))
+            context.pages.navigated()
+            return
+        # No direct URL known, so replay the click path we skipped.
+        context.driver.get(context.base_url)
+        context.homepage_loaded = True
+        click_card(context, context.selected_card)
+    click_submenu(context, submenu_name)
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Page objects shared by every step module.
+
+"""
+
+from support.pages.cache import ElementCache
+from support.pages.locators import LOCATORS, locator
+from support.pages.page import Page, Pages
+
+__all__ = ["ElementCache", "LOCATORS", "Page", "Pages", "locator"]
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Remember resolved element handles until the page changes under them.
+
+"""
+
+
+class ElementCache:
+    """Per-page map of resolved elements with hit/miss accounting."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._elements = {}
+
+    def get(self, key, resolve):
+        if key in self._elements:
+            self.hits += 1
+            return self._elements[key]
+        self.misses += 1
+        element = resolve()
+        self._elements[key] = element
+        return element
+
+    def put(self, key, element):
+        self._elements[key] = element
+
+    def drop(self, key, stale=False):
+        self._elements.pop(key, None)
+        if stale:
+            self.stale += 1
+
+    def clear(self):
+        self._elements.clear()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Central registry of every locator the suite uses, grouped by page.
+
+"""
+
+from selenium.webdriver.common.by import By
+
+
+# IDs and CSS selectors are preferred; XPath is kept only where an element can
+# be identified solely by its text. Values may contain str.format placeholders.
+LOCATORS = {
+    "home": {
+        "card": (By.XPATH, "//h5[text()='{name}']/ancestor::div[contains(@class, 'top-card')]"),
+    },
+    "menu": {
+        "submenu": (By.XPATH, "//span[text()='{name}']"),
+    },
+    "practice_form": {
+        "first_name": (By.ID, "firstName"),
+        "last_name": (By.ID, "lastName"),
+        "email": (By.ID, "userEmail"),
+        "mobile": (By.ID, "userNumber"),
+        "address": (By.ID, "currentAddress"),
+        "birth_date": (By.ID, "dateOfBirthInput"),
+        "month_select": (By.CSS_SELECTOR, ".react-datepicker__month-select"),
+        "year_select": (By.CSS_SELECTOR, ".react-datepicker__year-select"),
+        "day": (By.CSS_SELECTOR, ".react-datepicker__day--0{day:02d}:not(.react-datepicker__day--outside-month)"),
+        "subjects": (By.ID, "subjectsInput"),
+        "state": (By.ID, "state"),
+        "city": (By.ID, "city"),
+        "select_option": (By.XPATH, "//div[contains(@id,'{prefix}') and text()='{value}']"),
+        "upload": (By.ID, "uploadPicture"),
+        "submit": (By.ID, "submit"),
+        "modal": (By.CSS_SELECTOR, ".modal-content"),
+        "modal_values": (By.CSS_SELECTOR, ".modal-content td:nth-child(2)"),
+        "close_modal": (By.ID, "closeLargeModal"),
+    },
+    "web_tables": {
+        "add_button": (By.ID, "addNewRecordButton"),
+        "form": (By.ID, "userForm"),
+        "first_name": (By.ID, "firstName"),
+        "last_name": (By.ID, "lastName"),
+        "email": (By.ID, "userEmail"),
+        "age": (By.ID, "age"),
+        "salary": (By.ID, "salary"),
+        "department": (By.ID, "department"),
+        "submit": (By.ID, "submit"),
+        "rows_per_page": (By.CSS_SELECTOR, "select[aria-label='rows per page']"),
+        "row_by_email": (By.XPATH, "//div[@role='rowgroup']/div[@role='row'][.//div[text()='{email}']]"),
+        "cell": (By.XPATH, "//div[text()='{text}']"),
+        "edit_button": (By.CSS_SELECTOR, "span[title='Edit']"),
+        "delete_button": (By.CSS_SELECTOR, "span[title='Delete']"),
+    },
+    "progress_bar": {
+        "container": (By.ID, "progressBar"),
+        "bar": (By.CSS_SELECTOR, "div[role='progressbar']"),
+        "start_stop": (By.ID, "startStopButton"),
+        "reset": (By.ID, "resetButton"),
+    },
+    "sortable": {
+        "list_tab": (By.ID, "demo-tab-list"),
+        "grid_tab": (By.ID, "demo-tab-grid"),
+        "list_pane": (By.ID, "demo-tabpane-list"),
+        "grid_pane": (By.ID, "demo-tabpane-grid"),
+        "list_items": (By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.list-group-item-action"),
+        "grid_items": (By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item.list-group-item-action"),
+        "grid": (By.CSS_SELECTOR, "#demo-tabpane-grid .create-grid"),
+    },
+    "browser_windows": {
+        "new_window": (By.ID, "windowButton"),
+        "sample_heading": (By.ID, "sampleHeading"),
+    },
+}
+
+
+def locator(page, name, **params):
+    by, value = LOCATORS[page][name]
+    return by, value.format(**params) if params else value
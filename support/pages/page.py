@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Locator-driven page objects with a stale-aware element cache.
+
+"""
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+from support import waits as EC
+from support.cdp_channel import ChannelError
+from support.pages.cache import ElementCache
+from support.pages.locators import LOCATORS, locator
+from support.waits import WebDriverWait
+
+
+def cache_key(name, params):
+    return name, tuple(sorted(params.items()))
+
+
+class Page:
+    """Resolve registry locators for one page, reusing handles while they stay valid."""
+
+    def __init__(self, driver, name, channel=None):
+        self.driver = driver
+        self.name = name
+        self.channel = channel
+        self.cache = ElementCache()
+
+    def locator(self, element, **params):
+        return locator(self.name, element, **params)
+
+    def find(self, element, **params):
+        return self.cache.get(
+            cache_key(element, params),
+            lambda: self.driver.find_element(*self.locator(element, **params)),
+        )
+
+    def find_all(self, element, **params):
+        return self.driver.find_elements(*self.locator(element, **params))
+
+    def wait_for(self, element, condition=EC.visibility_of_element_located, timeout=10, **params):
+        found = WebDriverWait(self.driver, timeout).until(condition(self.locator(element, **params)))
+        if not isinstance(found, (list, bool)):
+            self.cache.put(cache_key(element, params), found)
+        return found
+
+    def use(self, element, action, **params):
+        try:
+            return action(self.find(element, **params))
+        except StaleElementReferenceException:
+            self.cache.drop(cache_key(element, params), stale=True)
+            return action(self.find(element, **params))
+
+    def scroll_into_view(self, element):
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+
+    def click(self, element, scroll=True, **params):
+        def action(found):
+            if scroll:
+                self.scroll_into_view(found)
+            found.click()
+
+        self.use(element, action, **params)
+
+    def type(self, element, text, clear=False, **params):
+        def action(found):
+            if clear:
+                found.clear()
+            found.send_keys(text)
+
+        self.use(element, action, **params)
+
+    def query(self, element, field, name=None, **params):
+        # Reads go over the DevTools channel when one is open; input always stays on WebDriver.
+        if self.channel is not None:
+            try:
+                result = self.channel.query(self.locator(element, **params), field, name)
+            except ChannelError:
+                pass
+            else:
+                if not result["found"]:
+                    raise NoSuchElementException(f"{self.name}.{element} not found")
+                return result["value"]
+        readers = {
+            "attribute": lambda found: found.get_attribute(name),
+            "text": lambda found: found.text,
+            "displayed": lambda found: found.is_displayed(),
+        }
+        return self.use(element, readers[field], **params)
+
+    def attribute(self, element, attribute, **params):
+        return self.query(element, "attribute", attribute, **params)
+
+    def text(self, element, **params):
+        return self.query(element, "text", **params)
+
+    def is_displayed(self, element, **params):
+        return self.query(element, "displayed", **params)
+
+    def forget(self, element, **params):
+        self.cache.drop(cache_key(element, params))
+
+
+class Pages:
+    """All page objects for one browser session; caches reset on navigation."""
+
+    def __init__(self, driver, on_navigate=None, channel=None):
+        self.driver = driver
+        self.on_navigate = on_navigate
+        self.channel = channel
+        self._pages = {}
+
+    def __getitem__(self, name):
+        if name not in LOCATORS:
+            raise KeyError(f"No locators registered for page {name!r}")
+        if name not in self._pages:
+            self._pages[name] = Page(self.driver, name, self.channel)
+        return self._pages[name]
+
+    def navigated(self):
+        for page in self._pages.values():
+            page.cache.clear()
+        if self.channel is not None:
+            self.channel.retarget()
+        if self.on_navigate is not None:
+            self.on_navigate(self.driver)
+
+    def stats(self):
+        caches = [page.cache for page in self._pages.values()]
+        return {
+            "hits": sum(cache.hits for cache in caches),
+            "misses": sum(cache.misses for cache in caches),
+            "stale": sum(cache.stale for cache in caches),
+        }
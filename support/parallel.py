@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Fan Behave scenarios out over worker processes and merge their results.
+
+Usage:
+    python -m support.parallel --workers 3 [paths ...] [-- extra behave args]
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from behave.parser import parse_file
+
+from support.data_factory import new_seed
+from support.rerun import load_state, merge_failed, save_state
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DURATIONS_FILE = BASE_DIR / ".behave_durations.json"
+REPORTS_DIR = BASE_DIR / "reports" / "parallel"
+
+
+def discover_scenarios(paths):
+    locations = []
+    for path in paths:
+        path = Path(path)
+        feature_files = sorted(path.rglob("*.feature")) if path.is_dir() else [path]
+        for feature_file in feature_files:
+            feature = parse_file(str(feature_file))
+            if feature is None:
+                continue
+            for scenario in feature.walk_scenarios():
+                locations.append(f"{os.path.relpath(feature_file, BASE_DIR)}:{scenario.line}")
+    return locations
+
+
+def load_durations():
+    if not DURATIONS_FILE.exists():
+        return {}
+    return json.loads(DURATIONS_FILE.read_text(encoding="utf-8"))
+
+
+def save_durations(durations):
+    DURATIONS_FILE.write_text(json.dumps(durations, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def schedule(locations, durations, workers):
+    # Unknown scenarios are assumed to be as slow as the slowest known one so
+    # they start early rather than becoming the tail of the run.
+    default = max(durations.values(), default=0.0)
+    ordered = sorted(locations, key=lambda loc: durations.get(loc, default), reverse=True)
+    buckets = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for location in ordered:
+        index = min(range(workers), key=lambda i: (loads[i], len(buckets[i])))
+        buckets[index].append(location)
+        loads[index] += durations.get(location, default)
+    return [bucket for bucket in buckets if bucket]
+
+
+def run_worker(worker_id, locations, extra_args):
+    worker_dir = REPORTS_DIR / f"worker-{worker_id}"
+    worker_dir.mkdir(parents=True, exist_ok=True)
+    json_report = worker_dir / "results.json"
+    command = [
+        sys.executable, "-m", "behave",
+        "-f", "json", "-o", str(json_report),
+        "--junit", "--junit-directory", str(worker_dir / "junit"),
+        "-D", f"worker_id={worker_id}",
+        "-D", "driver_pool=true",
+        *extra_args,
+        *locations,
+    ]
+    completed = subprocess.run(command, cwd=BASE_DIR, capture_output=True, text=True)
+    results = []
+    if json_report.exists() and json_report.stat().st_size:
+        results = json.loads(json_report.read_text(encoding="utf-8"))
+    return {
+        "worker_id": worker_id,
+        "locations": locations,
+        "returncode": completed.returncode,
+        "stdout": completed.stdout,
+        "stderr": completed.stderr,
+        "features": results,
+        "junit_dir": worker_dir / "junit",
+    }
+
+
+def scenario_duration(scenario):
+    return sum(step.get("result", {}).get("duration", 0.0) for step in scenario.get("steps", []))
+
+
+def merge_results(worker_results):
+    counts = {
+        "features": {"passed": 0, "failed": 0, "skipped": 0},
+        "scenarios": {"passed": 0, "failed": 0, "skipped": 0},
+        "steps": {"passed": 0, "failed": 0, "skipped": 0, "undefined": 0},
+    }
+    feature_status = {}
+    durations = {}
+    failed_locations = []
+    total_duration = 0.0
+
+    for result in worker_results:
+        for feature in result["features"]:
+            for scenario in feature.get("elements", []):
+                if scenario.get("type") == "background":
+                    continue
+                status = scenario.get("status", "skipped")
+                if status not in ("passed", "failed"):
+                    status = "failed" if "error" in status else "skipped"
+                counts["scenarios"][status] += 1
+                for step in scenario.get("steps", []):
+                    step_status = step.get("result", {}).get("status", "skipped")
+                    step_status = step_status if step_status in counts["steps"] else "skipped"
+                    counts["steps"][step_status] += 1
+                elapsed = scenario_duration(scenario)
+                total_duration += elapsed
+                if status != "skipped":
+                    durations[scenario["location"]] = elapsed
+                if status == "failed":
+                    failed_locations.append(scenario["location"])
+
+                previous = feature_status.get(feature["location"], "skipped")
+                if status == "failed" or previous == "failed":
+                    feature_status[feature["location"]] = "failed"
+                elif status == "passed" or previous == "passed":
+                    feature_status[feature["location"]] = "passed"
+                else:
+                    feature_status[feature["location"]] = "skipped"
+
+    for status in feature_status.values():
+        counts["features"][status] += 1
+    return counts, durations, failed_locations, total_duration
+
+
+def merge_junit(worker_results, output_file):
+    merged = ET.Element("testsuites")
+    for result in worker_results:
+        junit_dir = result["junit_dir"]
+        if not junit_dir.exists():
+            continue
+        for report_file in sorted(junit_dir.glob("*.xml")):
+            root = ET.parse(report_file).getroot()
+            suites = [root] if root.tag == "testsuite" else list(root)
+            for suite in suites:
+                suite.set("hostname", f"worker-{result['worker_id']}")
+                merged.append(suite)
+    for attribute in ("tests", "failures", "errors", "skipped"):
+        merged.set(attribute, str(sum(int(s.get(attribute, 0)) for s in merged)))
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(merged).write(output_file, encoding="utf-8", xml_declaration=True)
+
+
+def format_counts(label, values):
+    parts = [f"{count} {status}" for status, count in values.items()]
+    parts[0] = parts[0].replace(" ", f" {label} ", 1)
+    return ", ".join(parts)
+
+
+def format_elapsed(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes)}min {seconds:.3f}s"
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    extra_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(
+        prog="python -m support.parallel",
+        description="Run Behave scenarios in parallel worker processes.",
+    )
+    parser.add_argument("paths", nargs="*", default=["features"])
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--junit-file", default=str(BASE_DIR / "reports" / "junit.xml"))
+    args = parser.parse_args(argv)
+
+    locations = discover_scenarios(args.paths)
+    if not locations:
+        print("No scenarios found.")
+        return 1
+
+    # Every worker draws from the same seed so a failing run can be replayed as a whole.
+    if not any(arg.startswith("data_seed=") for arg in extra_args):
+        extra_args += ["-D", f"data_seed={new_seed()}"]
+
+    durations = load_durations()
+    buckets = schedule(locations, durations, max(1, args.workers))
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+        futures = [
+            executor.submit(run_worker, worker_id, bucket, extra_args)
+            for worker_id, bucket in enumerate(buckets)
+        ]
+        worker_results = [future.result() for future in futures]
+    wall_time = time.monotonic() - started
+
+    counts, new_durations, failed_locations, total_duration = merge_results(worker_results)
+    durations.update(new_durations)
+    save_durations(durations)
+    merge_junit(worker_results, Path(args.junit_file))
+    state = load_state()
+    state["failed"] = merge_failed(state["failed"], new_durations, failed_locations)
+    save_state(state)
+
+    crashed = [r for r in worker_results if r["returncode"] not in (0, 1) or not r["features"]]
+    for result in crashed:
+        print(f"Worker {result['worker_id']} exited with code {result['returncode']}:")
+        print(result["stderr"] or result["stdout"])
+
+    if failed_locations:
+        print("Failing scenarios:")
+        for location in failed_locations:
+            print(f"  {location}")
+    print(format_counts("features", counts["features"]))
+    print(format_counts("scenarios", counts["scenarios"]))
+    print(format_counts("steps", counts["steps"]))
+    print(f"Took {format_elapsed(total_duration)} across {len(buckets)} workers "
+          f"({format_elapsed(wall_time)} wall clock)")
+    print(f"JUnit report written to {args.junit_file}")
+    print(f"Test data {' '.join(arg for arg in extra_args if arg.startswith('data_seed='))}")
+
+    return 1 if failed_locations or crashed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
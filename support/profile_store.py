@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Manage persistent Chrome user-data-dirs that keep the HTTP cache but not session state.
+
+"""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+PROFILE_ROOT = BASE_DIR / ".cache" / "chrome-profiles"
+# Everything that could leak state between scenarios; the Cache and Code Cache folders stay.
+STATE_PATHS = (
+    "Default/Cookies",
+    "Default/Cookies-journal",
+    "Default/Network/Cookies",
+    "Default/Network/Cookies-journal",
+    "Default/Local Storage",
+    "Default/Session Storage",
+    "Default/IndexedDB",
+    "Default/Service Worker",
+    "Default/Sessions",
+    "Default/Current Session",
+    "Default/Current Tabs",
+    "Default/Last Session",
+    "Default/Last Tabs",
+)
+CACHE_PATH = "Default/Cache"
+
+
+class ProfileStore:
+    """Hand each Chrome launch a user-data-dir of its own, reusing them across runs."""
+
+    def __init__(self, root=PROFILE_ROOT, worker_id=None):
+        self.root = Path(root)
+        self.prefix = f"worker-{worker_id if worker_id is not None else 0}"
+        self.launches = 0
+        self.warm_launches = 0
+        self._claimed = set()
+        self._lock = threading.Lock()
+
+    def _slot(self, index):
+        return self.root / f"{self.prefix}-slot-{index}"
+
+    def claim(self):
+        with self._lock:
+            index = 0
+            # Chrome holds SingletonLock while a profile is open, e.g. by another run.
+            while self._slot(index) in self._claimed or os.path.lexists(self._slot(index) / "SingletonLock"):
+                index += 1
+            directory = self._slot(index)
+            self._claimed.add(directory)
+        self.launches += 1
+        if (directory / CACHE_PATH).exists():
+            self.warm_launches += 1
+        self.scrub(directory)
+        return directory
+
+    def release(self, directory):
+        with self._lock:
+            self._claimed.discard(directory)
+
+    def scrub(self, directory):
+        for relative in STATE_PATHS:
+            path = directory / relative
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.exists():
+                path.unlink()
+
+    def attach(self, driver, directory):
+        original_quit = driver.quit
+
+        def quit():
+            try:
+                original_quit()
+            finally:
+                self.release(directory)
+
+        driver.quit = quit
+        return driver
+
+    def summary_lines(self):
+        return [
+            f"profiles under {self.root}",
+            f"launches: {self.launches}, started with a warm cache: {self.warm_launches}",
+        ]
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Record the WebDriver command stream of a behave run and replay it as a fast smoke check.
+
+Usage:
+    behave features/browser_windows.feature -D record=recordings/browser_windows.json
+    python -m support.replay recordings/browser_windows.json -D headless=true
+
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from support.artifacts import RESOURCE_TIMINGS_SCRIPT
+from support.browser import NAVIGATION_TIMING_SCRIPT, BrowserProfile, create_driver
+from support.driver_pool import reset_driver_state
+from support.local_site import LocalSite
+from support.settle import SETTLE_SCRIPT
+from support.userdata import read_userdata
+from support.visual import MASK_RECTS_SCRIPT
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+REPORT_FILE = BASE_DIR / "reports" / "replay.json"
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+# Commands whose responses only feed reports or artifacts; recorded without a value, never replayed.
+OBSERVE_COMMANDS = {"screenshot", "elementScreenshot", "getPageSource", "getLog"}
+# Scripts that only wait for idle or measure the page; the replay skips them.
+OBSERVE_SCRIPTS = {SETTLE_SCRIPT, NAVIGATION_TIMING_SCRIPT, RESOURCE_TIMINGS_SCRIPT, MASK_RECTS_SCRIPT}
+# Responses made of window handles, which differ in every browser session.
+HANDLE_COMMANDS = {"w3cGetCurrentWindowHandle", "w3cGetWindowHandles", "newWindow"}
+# Errors the page may still be catching up on; the replay retries these instead of waiting up front.
+RETRY_ERRORS = {"no such element", "element not interactable", "element click intercepted"}
+# Response keys that carry timings rather than page state.
+VOLATILE_KEYS = {"valuesSeen", "latencyMs", "elapsed", "waited", "duration", "origin", "load", "domContentLoaded"}
+
+
+def response_error(response):
+    value = response.get("value") if isinstance(response, dict) else None
+    if isinstance(value, dict) and "error" in value and "message" in value:
+        return value["error"]
+    status = response.get("status", 0) if isinstance(response, dict) else 0
+    return str(status) if status not in (0, None, "success") else None
+
+
+def is_observation(command, params):
+    return command in OBSERVE_COMMANDS or (
+        command in ("w3cExecuteScript", "w3cExecuteScriptAsync") and params.get("script") in OBSERVE_SCRIPTS
+    )
+
+
+class CommandRecorder:
+    """Append every WebDriver command of the running scenario to an in-memory recording."""
+
+    def __init__(self, path, site_url=None):
+        self.path = Path(path)
+        self.site_url = site_url
+        self.scenarios = []
+        self._current = None
+        self._started = 0.0
+
+    def attach(self, driver):
+        executor = driver.command_executor
+        if getattr(executor, "_recorder", None) is self:
+            return driver
+        original_execute = executor.execute
+        recorder = self
+
+        def execute(command, params):
+            if recorder._current is None:
+                return original_execute(command, params)
+            # Selenium deletes the URL parameters from params while building the request.
+            recorded = json.loads(json.dumps(params or {}, default=str))
+            recorded.pop("sessionId", None)
+            started = time.perf_counter()
+            response = original_execute(command, params)
+            entry = {
+                "t": started - recorder._started,
+                "elapsed": time.perf_counter() - started,
+                "command": command,
+                "params": recorded,
+                "error": response_error(response),
+            }
+            if is_observation(command, recorded):
+                entry["observe"] = True
+            else:
+                entry["value"] = json.loads(json.dumps(response.get("value") if response else None, default=str))
+            recorder._current["commands"].append(entry)
+            return response
+
+        executor.execute = execute
+        executor._recorder = self
+        return driver
+
+    def begin(self, scenario):
+        self._started = time.perf_counter()
+        self._current = {"name": scenario.name, "location": str(scenario.location), "commands": []}
+
+    def end(self, scenario):
+        if self._current is None:
+            return
+        self._current["duration"] = time.perf_counter() - self._started
+        self._current["status"] = scenario.status.name
+        self.scenarios.append(self._current)
+        self._current = None
+
+    def write(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        recording = {
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "site_url": self.site_url,
+            "scenarios": self.scenarios,
+        }
+        self.path.write_text(json.dumps(recording, indent=2), encoding="utf-8")
+        return self.path
+
+    def summary_lines(self):
+        commands = sum(len(scenario["commands"]) for scenario in self.scenarios)
+        duration = sum(scenario["duration"] for scenario in self.scenarios)
+        return [
+            f"scenarios recorded: {len(self.scenarios)}, commands: {commands}, scenario time: {duration:.1f}s",
+            f"replay with: python -m support.replay {self.path}",
+        ]
+
+
+def strip_volatile(value):
+    if isinstance(value, dict):
+        return {key: strip_volatile(item) for key, item in value.items() if key not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [strip_volatile(item) for item in value]
+    return value
+
+
+class Replayer:
+    """Send recorded commands straight to a live session, translating ids it has learned."""
+
+    def __init__(self, driver, recorded_site=None, site_url=None, find_timeout=10.0):
+        self.driver = driver
+        self.recorded_site = recorded_site
+        self.site_url = site_url
+        self.find_timeout = find_timeout
+        self.ids = {}
+
+    def translate(self, value):
+        if isinstance(value, dict):
+            return {key: self.translate(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.translate(item) for item in value]
+        if isinstance(value, str):
+            if value in self.ids:
+                return self.ids[value]
+            if self.recorded_site and self.site_url and value.startswith(self.recorded_site):
+                return self.site_url + value[len(self.recorded_site):]
+        return value
+
+    def learn(self, recorded, actual, handles=False):
+        if isinstance(recorded, dict) and isinstance(actual, dict):
+            for key, item in recorded.items():
+                if key == ELEMENT_KEY and isinstance(item, str) and isinstance(actual.get(key), str):
+                    self.ids[item] = actual[key]
+                elif key in actual:
+                    self.learn(item, actual[key], handles)
+        elif isinstance(recorded, list) and isinstance(actual, list):
+            for recorded_item, actual_item in zip(recorded, actual):
+                self.learn(recorded_item, actual_item, handles)
+        elif handles and isinstance(recorded, str) and isinstance(actual, str):
+            self.ids[recorded] = actual
+
+    def execute(self, entry):
+        params = self.translate(entry["params"])
+        params["sessionId"] = self.driver.session_id
+        executor = self.driver.command_executor
+        deadline = time.monotonic() + self.find_timeout
+        while True:
+            # execute() consumes the URL parameters, so every attempt gets a fresh copy.
+            response = executor.execute(entry["command"], dict(params))
+            error = response_error(response)
+            if error not in RETRY_ERRORS or time.monotonic() >= deadline:
+                return response, error
+            time.sleep(0.05)
+
+    def replay(self, scenario):
+        result = {
+            "name": scenario["name"],
+            "location": scenario["location"],
+            "recorded": scenario["duration"],
+            "replayed": 0,
+            "skipped": 0,
+            "divergences": [],
+        }
+        started = time.perf_counter()
+        for index, entry in enumerate(scenario["commands"]):
+            # Failed polls were the wait loop asking too early; the replay retries finds instead.
+            if entry.get("observe") or entry["error"]:
+                result["skipped"] += 1
+                continue
+            response, error = self.execute(entry)
+            result["replayed"] += 1
+            if error:
+                result["divergences"].append({
+                    "index": index, "command": entry["command"], "expected": "success", "actual": error,
+                    "message": response["value"].get("message", "") if isinstance(response.get("value"), dict)
+                    else "",
+                })
+                break
+            actual = response.get("value")
+            self.learn(entry["value"], actual, handles=entry["command"] in HANDLE_COMMANDS)
+            expected = strip_volatile(self.translate(entry["value"]))
+            if expected != strip_volatile(actual):
+                result["divergences"].append({
+                    "index": index, "command": entry["command"], "expected": expected, "actual": actual,
+                })
+        result["time"] = time.perf_counter() - started
+        return result
+
+
+def describe_value(value, limit=80):
+    text = json.dumps(value, default=str)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m support.replay",
+        description="Replay a recorded WebDriver command stream and flag responses that diverge.",
+    )
+    parser.add_argument("recording", help="file written by a behave run with -D record=<path>")
+    parser.add_argument("-D", "--define", action="append", default=[], help="behave userdata override")
+    parser.add_argument("--find-timeout", type=float, default=10.0,
+                        help="seconds to keep retrying a command whose element is not ready yet")
+    parser.add_argument("--include-failed", action="store_true", help="also replay scenarios that failed")
+    parser.add_argument("--report", default=str(REPORT_FILE))
+    args = parser.parse_args(argv)
+
+    recording = json.loads(Path(args.recording).read_text(encoding="utf-8"))
+    scenarios = [
+        scenario for scenario in recording["scenarios"]
+        if args.include_failed or scenario["status"] == "passed"
+    ]
+    if not scenarios:
+        print("No passed scenarios in the recording.")
+        return 1
+
+    userdata = read_userdata(args.define)
+    site = None
+    site_url = None
+    if recording["site_url"]:
+        site = LocalSite()
+        site_url = site.start()
+    driver = create_driver(BrowserProfile.from_userdata(userdata))
+    replayer = Replayer(driver, recording["site_url"], site_url, args.find_timeout)
+
+    results = []
+    try:
+        for scenario in scenarios:
+            results.append(replayer.replay(scenario))
+            reset_driver_state(driver)
+    finally:
+        driver.quit()
+        if site is not None:
+            site.stop()
+
+    recorded = sum(result["recorded"] for result in results)
+    replayed = sum(result["time"] for result in results)
+    report_path = Path(args.report)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps({"recording": args.recording, "scenarios": results}, indent=2),
+                           encoding="utf-8")
+
+    for result in results:
+        status = f"{len(result['divergences'])} divergences" if result["divergences"] else "ok"
+        print(f"{result['name']}: {result['time']:.2f}s vs {result['recorded']:.2f}s recorded, "
+              f"{result['replayed']} commands replayed, {result['skipped']} skipped, {status}")
+        for divergence in result["divergences"][:5]:
+            print(f"  #{divergence['index']} {divergence['command']}: expected "
+                  f"{describe_value(divergence['expected'])}, got {describe_value(divergence['actual'])}")
+    speedup = recorded / replayed if replayed else 0.0
+    print(f"Replay took {replayed:.1f}s against {recorded:.1f}s recorded ({speedup:.1f}x faster)")
+    print(f"Report written to {report_path}")
+    return 1 if any(result["divergences"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
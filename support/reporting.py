@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Print end-of-run summaries that survive Behave's output capture.
+
+"""
+
+import sys
+
+
+def report(title, lines):
+    # Behave captures sys.stdout inside hooks, so write to the real stream.
+    stream = sys.__stdout__
+    stream.write(f"\n{title}:\n")
+    for line in lines:
+        stream.write(f"  {line}\n")
+    stream.flush()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Track failing and flaky scenarios and rerun only the failures on a warm browser.
+
+Usage:
+    python -m support.rerun --retries 2
+    python -m support.rerun --run-first features/web_tables.feature -- -D site=local
+
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+from behave.contrib.scenario_autoretry import patch_scenario_with_autoretry
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+STATE_FILE = BASE_DIR / ".behave_rerun.json"
+
+
+def load_state(path=STATE_FILE):
+    path = Path(path)
+    if not path.exists():
+        return {"failed": [], "flaky": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_state(state, path=STATE_FILE):
+    Path(path).write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def merge_failed(previous, ran, failed):
+    # Failures from scenarios outside this run stay recorded until they are run again.
+    return sorted((set(previous) - set(ran)) | set(failed))
+
+
+def enable_retries(feature, retries):
+    for scenario in feature.walk_scenarios():
+        patch_scenario_with_autoretry(scenario, max_attempts=retries + 1)
+
+
+class RunState:
+    """Per-scenario attempt outcomes for one behave process."""
+
+    def __init__(self):
+        self.attempts = {}
+        self.names = {}
+
+    def record(self, scenario):
+        status = scenario.status.name
+        if status not in ("passed", "failed", "error"):
+            return
+        location = str(scenario.location)
+        self.names[location] = scenario.name
+        self.attempts.setdefault(location, []).append("passed" if status == "passed" else "failed")
+
+    def failed(self):
+        return sorted(location for location, attempts in self.attempts.items() if attempts[-1] == "failed")
+
+    def flaky(self):
+        return sorted(
+            location for location, attempts in self.attempts.items()
+            if attempts[-1] == "passed" and "failed" in attempts
+        )
+
+    def save(self, path=STATE_FILE):
+        # Flaky history is kept across runs so repeat offenders can be quarantined.
+        state = load_state(path)
+        rerun = set(state["failed"])
+        state["failed"] = merge_failed(state["failed"], self.attempts, self.failed())
+        for location in self.flaky():
+            entry = state["flaky"].setdefault(location, {"name": self.names[location], "count": 0})
+            entry["count"] += 1
+            entry["last_seen"] = date.today().isoformat()
+            entry["recovered_on_rerun"] = location in rerun
+        save_state(state, path)
+        return state
+
+    def summary_lines(self, state):
+        lines = [
+            f"scenarios run: {len(self.attempts)}, still failing: {len(state['failed'])}, "
+            f"flaky this run: {len(self.flaky())}",
+        ]
+        for location in self.flaky():
+            attempts = self.attempts[location]
+            lines.append(f"  FLAKY  {location}  passed on attempt {len(attempts)} "
+                         f"(flaky {state['flaky'][location]['count']}x so far)")
+        lines.extend(f"  FAILED {location}" for location in state["failed"])
+        if state["failed"]:
+            lines.append("rerun the failures with: python -m support.rerun")
+        return lines
+
+
+def run_behave(locations, extra_args):
+    command = [sys.executable, "-m", "behave", *extra_args, *locations]
+    started = time.monotonic()
+    completed = subprocess.run(command, cwd=BASE_DIR)
+    return completed.returncode, time.monotonic() - started
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    extra_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(
+        prog="python -m support.rerun",
+        description="Rerun the scenarios that failed last time, marking the ones that recover as flaky.",
+    )
+    parser.add_argument("paths", nargs="*", default=["features"])
+    parser.add_argument("-r", "--retries", type=int, default=2, help="extra attempts per failing scenario")
+    parser.add_argument("--run-first", action="store_true",
+                        help="run the given paths first, then rerun whatever failed")
+    args = parser.parse_args(argv)
+
+    if args.run_first or not load_state()["failed"]:
+        if not args.run_first:
+            print("No recorded failures; running the full selection first.")
+        _, elapsed = run_behave(args.paths, extra_args)
+        print(f"Initial run took {elapsed:.1f}s")
+
+    failed = load_state()["failed"]
+    if not failed:
+        print("Nothing to rerun.")
+        return 0
+
+    # One pooled browser serves every retried scenario and every retry attempt.
+    print(f"Rerunning {len(failed)} failed scenarios with up to {args.retries} retries each")
+    returncode, elapsed = run_behave(
+        failed, ["-D", "driver_pool=true", "-D", f"retries={args.retries}", *extra_args]
+    )
+    state = load_state()
+    print(f"Rerun took {elapsed:.1f}s; {len(state['failed'])} scenarios still failing")
+    return 1 if state["failed"] or returncode not in (0, 1) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
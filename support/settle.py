@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Wait for the page to go idle after each step instead of sleeping blindly.
+
+"""
+
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+
+# Resolves once the document has seen no DOM mutations, finite animations or
+# in-flight fetch/XHR requests for `quietMs`, or after `timeoutMs` regardless.
+SETTLE_SCRIPT = """
+const quietMs = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+
+if (!window.__settleState) {
+  const state = { pending: 0, lastActivity: performance.now() };
+  const touch = () => { state.lastActivity = performance.now(); };
+  new MutationObserver(touch).observe(document, {
+    subtree: true, childList: true, attributes: true, characterData: true,
+  });
+  if (window.fetch) {
+    const originalFetch = window.fetch;
+    window.fetch = function () {
+      state.pending += 1;
+      return originalFetch.apply(this, arguments).finally(() => { state.pending -= 1; touch(); });
+    };
+  }
+  const originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    state.pending += 1;
+    this.addEventListener('loadend', () => { state.pending -= 1; touch(); }, { once: true });
+    return originalSend.apply(this, arguments);
+  };
+  window.__settleState = state;
+}
+
+const state = window.__settleState;
+const start = performance.now();
+
+function animating() {
+  if (!document.getAnimations) {
+    return false;
+  }
+  return document.getAnimations().some((animation) => animation.playState === 'running'
+    && animation.effect && animation.effect.getComputedTiming().iterations !== Infinity);
+}
+
+function check() {
+  const now = performance.now();
+  if (document.readyState !== 'complete' || state.pending > 0 || animating()) {
+    state.lastActivity = now;
+  }
+  if (now - state.lastActivity >= quietMs) {
+    done({ settled: true, waited: now - start });
+  } else if (now - start >= timeoutMs) {
+    done({ settled: false, waited: now - start });
+  } else {
+    setTimeout(check, 25);
+  }
+}
+
+check();
+"""
+
+
+def skip_settle(context):
+    # Steps call this when the page is expected to keep changing afterwards.
+    context.skip_settle = True
+
+
+class SettleEngine:
+    """Block until the browser reports an idle page, bounded by a timeout."""
+
+    def __init__(self, quiet_ms=150, timeout_ms=1000):
+        self.quiet_ms = quiet_ms
+        self.timeout_ms = timeout_ms
+        self.records = []
+
+    def settle(self, driver, step_name):
+        started = time.perf_counter()
+        try:
+            result = driver.execute_async_script(SETTLE_SCRIPT, self.quiet_ms, self.timeout_ms)
+            settled = bool(result and result.get("settled"))
+        except WebDriverException:
+            settled = False
+        waited = time.perf_counter() - started
+        self.records.append({"step": step_name, "waited": waited, "settled": settled, "skipped": False})
+        return waited
+
+    def skip(self, step_name):
+        self.records.append({"step": step_name, "waited": 0.0, "settled": True, "skipped": True})
+
+    def summary_lines(self, top=5):
+        total = sum(record["waited"] for record in self.records)
+        # settle=false sleeps a flat second after every step, whatever settle_timeout_ms is.
+        fixed_sleep = len(self.records) * 1.0
+        timeouts = [record for record in self.records if not record["settled"]]
+        skipped = [record for record in self.records if record["skipped"]]
+        lines = [
+            f"steps settled: {len(self.records)} ({len(skipped)} opted out, {len(timeouts)} hit the timeout)",
+            f"time spent settling: {total:.2f}s (the fixed 1s sleep would be {fixed_sleep:.2f}s)",
+        ]
+        slowest = sorted(self.records, key=lambda record: record["waited"], reverse=True)[:top]
+        for record in slowest:
+            lines.append(f"{record['waited'] * 1000:7.0f} ms  {record['step']}")
+        return lines
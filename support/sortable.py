@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Reorder the DemoQA sortable widgets with the fewest possible drags.
+
+"""
+
+from bisect import bisect_left
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver import ActionChains
+
+from support import waits as EC
+from support.pages import locator
+from support.waits import WebDriverWait
+
+READ_ORDER_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0])).map((item) => item.textContent.trim());
+"""
+
+
+def items_locator(tab):
+    return locator("sortable", f"{tab}_items")
+
+
+def read_order(driver, tab="list"):
+    return driver.execute_script(READ_ORDER_SCRIPT, items_locator(tab)[1])
+
+
+def target_order(items, order="ascending", key=None):
+    if order == "ascending":
+        return sorted(items, key=key)
+    if order == "descending":
+        return sorted(items, key=key, reverse=True)
+    raise ValueError(f"Unknown sort order: {order}")
+
+
+def longest_ordered_subsequence(ranks):
+    # Patience sorting: O(n log n) longest strictly increasing subsequence.
+    tails = []
+    tail_positions = []
+    previous = [-1] * len(ranks)
+    for position, rank in enumerate(ranks):
+        slot = bisect_left(tails, rank)
+        if slot == len(tails):
+            tails.append(rank)
+            tail_positions.append(position)
+        else:
+            tails[slot] = rank
+            tail_positions[slot] = position
+        previous[position] = tail_positions[slot - 1] if slot else -1
+
+    kept = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position != -1:
+        kept.add(position)
+        position = previous[position]
+    return kept
+
+
+def plan_moves(current, desired):
+    if sorted(current) != sorted(desired):
+        raise ValueError("The desired order must contain exactly the current items")
+
+    ranks = {item: rank for rank, item in enumerate(desired)}
+    kept_positions = longest_ordered_subsequence([ranks[item] for item in current])
+    kept = {current[position] for position in kept_positions}
+
+    working = list(current)
+    moves = []
+    for rank, item in enumerate(desired):
+        if item in kept:
+            continue
+        source = working.index(item)
+        working.pop(source)
+        destination = working.index(desired[rank - 1]) + 1 if rank else 0
+        working.insert(destination, item)
+        if source != destination:
+            moves.append((item, source, destination))
+    return moves
+
+
+def drag(driver, source, target):
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", target)
+    ActionChains(driver).click_and_hold(source).move_to_element(target).release().perform()
+
+
+def sort_items(driver, tab="list", order="ascending", key=None, desired=None, timeout=10):
+    driver.find_element(*locator("sortable", f"{tab}_tab")).click()
+    # Items in a pane that is still hidden cannot be read in order or dragged.
+    WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(locator("sortable", f"{tab}_pane")))
+    current = read_order(driver, tab)
+    desired = desired or target_order(current, order, key)
+    moves = plan_moves(current, desired)
+
+    elements = dict(zip(current, driver.find_elements(*items_locator(tab))))
+    working = list(current)
+    for item, source, destination in moves:
+        target_item = working[destination]
+        try:
+            drag(driver, elements[item], elements[target_item])
+        except StaleElementReferenceException:
+            elements = dict(zip(read_order(driver, tab), driver.find_elements(*items_locator(tab))))
+            drag(driver, elements[item], elements[target_item])
+        working.pop(source)
+        working.insert(destination, item)
+    return {"desired": desired, "moves": len(moves)}
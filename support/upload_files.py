@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Generate large upload files on disk without holding them in memory, cached by size and type.
+
+"""
+
+import mmap
+import re
+import time
+from pathlib import Path
+
+from support.waits import script_timeout
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+CACHE_DIR = BASE_DIR / ".cache" / "uploads"
+UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+# Just enough of each format's header for pickers and MIME sniffing; the rest is sparse zeros.
+HEADERS = {
+    "bin": b"",
+    "png": b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR",
+    "jpg": b"\xff\xd8\xff\xe0\x00\x10JFIF\x00",
+    "pdf": b"%PDF-1.4\n",
+    "zip": b"PK\x03\x04",
+}
+TEXT_LINE = b"The quick brown fox jumps over the lazy dog 0123456789\n"
+MMAP_WINDOW = 16 * 1024 * 1024
+
+# Resolves once the file input reports a selected file of the expected size.
+FILE_ACCEPTED_SCRIPT = """
+const [input, expectedSize] = arguments;
+const done = arguments[arguments.length - 1];
+const check = () => {
+  const file = input.files && input.files[0];
+  if (file && file.size === expectedSize) {
+    done({ name: file.name, size: file.size });
+  } else {
+    setTimeout(check, 10);
+  }
+};
+check();
+"""
+
+
+def parse_size(text):
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B)\s*", text.upper())
+    if match is None:
+        raise ValueError(f"Unrecognised file size: {text!r} (use e.g. 512KB, 20MB, 1GB)")
+    return int(float(match.group(1)) * UNITS[match.group(2)])
+
+
+def write_text_file(path, size):
+    # Fill through a sliding memory map so only one window is resident at a time.
+    with open(path, "wb") as handle:
+        handle.truncate(size)
+    if not size:
+        return
+    with open(path, "r+b") as handle:
+        for offset in range(0, size, MMAP_WINDOW):
+            length = min(MMAP_WINDOW, size - offset)
+            with mmap.mmap(handle.fileno(), length, offset=offset) as window:
+                pattern = TEXT_LINE * (length // len(TEXT_LINE) + 1)
+                window[:] = pattern[:length]
+
+
+def write_sparse_file(path, size, header):
+    # Only the header is written; the filesystem stores the remainder as a hole.
+    with open(path, "wb") as handle:
+        handle.write(header[:size])
+        handle.truncate(size)
+
+
+def generated_file(size, file_type, cache_dir=CACHE_DIR):
+    size = parse_size(size) if isinstance(size, str) else size
+    file_type = file_type.lower().lstrip(".")
+    if file_type not in HEADERS and file_type != "txt":
+        raise ValueError(f"Unsupported upload type {file_type!r}; use txt or one of {', '.join(HEADERS)}")
+
+    cache_dir = Path(cache_dir)
+    path = cache_dir / f"upload-{size}.{file_type}"
+    if path.exists() and path.stat().st_size == size:
+        return path, False
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(path.suffix + ".part")
+    if file_type == "txt":
+        write_text_file(partial, size)
+    else:
+        write_sparse_file(partial, size, HEADERS[file_type])
+    partial.replace(path)
+    return path, True
+
+
+def upload_file(driver, input_element, path, timeout=120):
+    size = Path(path).stat().st_size
+    with script_timeout(driver, timeout):
+        started = time.perf_counter()
+        input_element.send_keys(str(path))
+        sent = time.perf_counter()
+        accepted = driver.execute_async_script(FILE_ACCEPTED_SCRIPT, input_element, size)
+        finished = time.perf_counter()
+    return {
+        "file": Path(path).name,
+        "size": size,
+        "accepted_name": accepted["name"],
+        "send_keys_seconds": sent - started,
+        "accept_seconds": finished - started,
+        "throughput_mb_s": size / (1024 ** 2) / (finished - started) if finished > started else 0.0,
+    }
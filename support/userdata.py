@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Read behave.ini userdata for the standalone tools that run outside behave.
+
+"""
+
+import configparser
+from pathlib import Path
+
+from behave.configuration import UserData
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+
+def read_userdata(defines=(), **overrides):
+    parser = configparser.ConfigParser()
+    parser.read(BASE_DIR / "behave.ini", encoding="utf-8")
+    values = dict(parser["behave.userdata"]) if parser.has_section("behave.userdata") else {}
+    for define in defines:
+        key, _, value = define.partition("=")
+        values[key] = value
+    values.update(overrides)
+    return UserData(values)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Compare element and page screenshots with stored baselines using NumPy.
+
+"""
+
+import hashlib
+import json
+import re
+from io import BytesIO
+from pathlib import Path
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+BASELINE_DIR = BASE_DIR / "resources" / "baselines"
+OUTPUT_DIR = BASE_DIR / "reports" / "visual"
+# Hashes of captures that passed within tolerance, kept out of the versioned baselines;
+# an identical capture later skips decoding.
+CACHE_DIR = BASE_DIR / ".cache" / "visual"
+ACCEPTED_HASHES = 20
+
+# Mask rectangles in screenshot pixels, relative to the captured element (or the viewport).
+MASK_RECTS_SCRIPT = """
+const [element, masks] = arguments;
+const origin = element ? element.getBoundingClientRect() : { left: 0, top: 0 };
+const ratio = window.devicePixelRatio || 1;
+return masks.map((mask) => {
+  const rect = mask.getBoundingClientRect();
+  return [
+    Math.floor((rect.left - origin.left) * ratio),
+    Math.floor((rect.top - origin.top) * ratio),
+    Math.ceil(rect.width * ratio),
+    Math.ceil(rect.height * ratio),
+  ];
+});
+"""
+
+
+class VisualMismatch(AssertionError):
+    """A capture differs from its baseline by more than the tolerance."""
+
+
+def decode(png):
+    # NumPy and Pillow are only needed once a capture differs from every known hash.
+    import numpy as np
+    from PIL import Image
+
+    return np.asarray(Image.open(BytesIO(png)).convert("RGB"), dtype=np.int16)
+
+
+def mask_array(shape, rects):
+    import numpy as np
+
+    mask = np.zeros(shape[:2], dtype=bool)
+    for x, y, width, height in rects:
+        mask[max(0, y):max(0, y + height), max(0, x):max(0, x + width)] = True
+    return mask
+
+
+def write_diff_image(path, actual, changed, masked):
+    import numpy as np
+    from PIL import Image
+
+    image = (actual * 0.35).astype(np.uint8)
+    image[masked] = (image[masked] * 0.5 + np.array([0, 0, 120])).astype(np.uint8)
+    image[changed] = (255, 0, 0)
+    Image.fromarray(image).save(path)
+
+
+class VisualCheckpoints:
+    """Baseline store and comparator for named visual checkpoints."""
+
+    def __init__(self, baseline_dir=BASELINE_DIR, output_dir=OUTPUT_DIR, cache_dir=CACHE_DIR, tolerance=0.001,
+                 threshold=16, update=False):
+        self.baseline_dir = Path(baseline_dir)
+        self.output_dir = Path(output_dir)
+        self.cache_dir = Path(cache_dir)
+        self.tolerance = tolerance
+        self.threshold = threshold
+        self.update = update
+        self.stats = {"checks": 0, "hash_hits": 0, "compared": 0, "mismatches": 0, "new_baselines": 0}
+        self._decoded = {}
+
+    def _paths(self, name):
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", name)
+        return self.baseline_dir / f"{slug}.png", self.baseline_dir / f"{slug}.json"
+
+    def _accepted_path(self, name):
+        return self.cache_dir / self._paths(name)[1].name
+
+    def _accepted(self, name, baseline_digest):
+        path = self._accepted_path(name)
+        if not path.exists():
+            return []
+        cached = json.loads(path.read_text(encoding="utf-8"))
+        # Hashes accepted against an older baseline no longer count.
+        return cached["accepted"] if cached.get("baseline") == baseline_digest else []
+
+    def _accept(self, name, baseline_digest, accepted):
+        path = self._accepted_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"baseline": baseline_digest, "accepted": accepted}, indent=2), encoding="utf-8")
+
+    def _save_baseline(self, name, png, digest):
+        image_path, meta_path = self._paths(name)
+        image_path.parent.mkdir(parents=True, exist_ok=True)
+        image_path.write_bytes(png)
+        meta_path.write_text(json.dumps({"sha256": digest}, indent=2), encoding="utf-8")
+        self.stats["new_baselines"] += 1
+
+    def _baseline_pixels(self, image_path, digest):
+        if digest not in self._decoded:
+            self._decoded[digest] = decode(image_path.read_bytes())
+        return self._decoded[digest]
+
+    def check(self, driver, name, element=None, masks=()):
+        self.stats["checks"] += 1
+        png = element.screenshot_as_png if element is not None else driver.get_screenshot_as_png()
+        digest = hashlib.sha256(png).hexdigest()
+        image_path, meta_path = self._paths(name)
+
+        if self.update:
+            self._save_baseline(name, png, digest)
+            return {"status": "baseline", "path": image_path}
+        if not meta_path.exists():
+            self.stats["mismatches"] += 1
+            raise VisualMismatch(
+                f"Checkpoint {name!r} has no baseline at {image_path}; review one with -D visual_update=true"
+            )
+
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        accepted = self._accepted(name, meta["sha256"])
+        if digest == meta["sha256"] or digest in accepted:
+            self.stats["hash_hits"] += 1
+            return {"status": "match", "ratio": 0.0}
+
+        self.stats["compared"] += 1
+        actual = decode(png)
+        baseline = self._baseline_pixels(image_path, meta["sha256"])
+        rects = driver.execute_script(MASK_RECTS_SCRIPT, element, list(masks)) if masks else []
+        masked = mask_array(actual.shape, rects)
+
+        if actual.shape != baseline.shape:
+            ratio = 1.0
+            changed = ~masked
+        else:
+            changed = (abs(actual - baseline).max(axis=2) > self.threshold) & ~masked
+            compared = max(1, masked.size - int(masked.sum()))
+            ratio = int(changed.sum()) / compared
+
+        if ratio <= self.tolerance:
+            self._accept(name, meta["sha256"], ([digest] + accepted)[:ACCEPTED_HASHES])
+            return {"status": "match", "ratio": ratio}
+
+        self.stats["mismatches"] += 1
+        folder = self.output_dir / image_path.stem
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / "actual.png").write_bytes(png)
+        (folder / "baseline.png").write_bytes(image_path.read_bytes())
+        write_diff_image(folder / "diff.png", actual, changed, masked)
+        detail = "size differs" if actual.shape != baseline.shape else f"{ratio:.4%} of pixels differ"
+        raise VisualMismatch(
+            f"Checkpoint {name!r}: {detail} (tolerance {self.tolerance:.4%}); see {folder / 'diff.png'}"
+        )
+
+    def summary_lines(self):
+        stats = self.stats
+        return [
+            f"checkpoints: {stats['checks']}, matched by hash: {stats['hash_hits']}, "
+            f"pixel-compared: {stats['compared']}",
+            f"mismatches: {stats['mismatches']}, new baselines recorded: {stats['new_baselines']}",
+        ]
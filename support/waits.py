@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Evaluate explicit-wait conditions inside the page instead of polling from the client.
+
+"""
+
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait as ClientWait
+
+
+# Checks the condition now, then again on every DOM mutation and animation frame until it
+# holds or the timeout passes. Resolves with the matched element(s), true, or a timeout marker.
+WAIT_SCRIPT = """
+const [kind, strategy, value, expected, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+const byXPath = (path) => {
+  const result = document.evaluate(path, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  return Array.from({ length: result.snapshotLength }, (_, index) => result.snapshotItem(index));
+};
+const finders = {
+  'css selector': (text) => Array.from(document.querySelectorAll(text)),
+  'id': (text) => Array.from(document.querySelectorAll('#' + CSS.escape(text))),
+  'class name': (text) => Array.from(document.getElementsByClassName(text)),
+  'tag name': (text) => Array.from(document.getElementsByTagName(text)),
+  'name': (text) => Array.from(document.getElementsByName(text)),
+  'xpath': byXPath,
+};
+const find = finders[strategy];
+
+const visible = (element) => {
+  const style = getComputedStyle(element);
+  return style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0'
+    && element.getClientRects().length > 0;
+};
+const checks = {
+  presence: () => find(value)[0] || null,
+  presence_all: () => {
+    const elements = find(value);
+    return elements.length ? elements : null;
+  },
+  visibility: () => {
+    const element = find(value)[0];
+    return element && visible(element) ? element : null;
+  },
+  clickable: () => {
+    const element = find(value)[0];
+    return element && visible(element) && !element.disabled ? element : null;
+  },
+  invisibility: () => {
+    const element = find(value)[0];
+    return !element || !visible(element) ? true : null;
+  },
+  attribute_text: () => {
+    const element = find(value)[0];
+    const current = element && element.getAttribute(expected[0]);
+    return current !== null && current !== undefined && current.includes(expected[1]) ? true : null;
+  },
+  value_text: () => {
+    const element = find(value)[0];
+    return element && String(element.value).includes(expected) ? true : null;
+  },
+};
+const check = checks[kind];
+
+const initial = check();
+if (initial) {
+  done(initial);
+  return;
+}
+
+let finished = false;
+let frame = null;
+const observer = new MutationObserver(() => evaluate());
+const timer = setTimeout(() => finish({ timeout: true }), timeoutMs);
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearTimeout(timer);
+  cancelAnimationFrame(frame);
+  done(result);
+}
+function evaluate() {
+  const result = check();
+  if (result) finish(result);
+}
+function tick() {
+  evaluate();
+  if (!finished) frame = requestAnimationFrame(tick);
+}
+observer.observe(document.documentElement, {
+  subtree: true, childList: true, attributes: true, characterData: true,
+});
+frame = requestAnimationFrame(tick);
+"""
+
+SUPPORTED_STRATEGIES = {"css selector", "id", "class name", "tag name", "name", "xpath"}
+# Client-side polling interval for conditions the page cannot observe (window count).
+CLIENT_POLL = 0.05
+# Selenium's default script timeout; longer waits raise it for the session first.
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+
+@contextmanager
+def script_timeout(driver, seconds):
+    # Pooled sessions outlive the scenario, so a raised timeout must not leak into the next one.
+    previous = driver.timeouts.script
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        driver.set_script_timeout(previous)
+
+
+class BrowserCondition:
+    """A wait condition that can run inside the page or, as a fallback, as a classic EC."""
+
+    def __init__(self, kind, locator, fallback, expected=None):
+        self.kind = kind
+        self.locator = locator
+        self.fallback = fallback
+        self.expected = expected
+
+    def __call__(self, driver):
+        # Plain WebDriverWait instances still get the classic single check.
+        return self.fallback(driver)
+
+    def evaluate(self, driver, timeout):
+        strategy, value = self.locator
+        return driver.execute_async_script(
+            WAIT_SCRIPT, self.kind, strategy, value, self.expected, int(timeout * 1000)
+        )
+
+
+def presence_of_element_located(locator):
+    return BrowserCondition("presence", locator, expected_conditions.presence_of_element_located(locator))
+
+
+def presence_of_all_elements_located(locator):
+    return BrowserCondition("presence_all", locator, expected_conditions.presence_of_all_elements_located(locator))
+
+
+def visibility_of_element_located(locator):
+    return BrowserCondition("visibility", locator, expected_conditions.visibility_of_element_located(locator))
+
+
+def element_to_be_clickable(locator):
+    return BrowserCondition("clickable", locator, expected_conditions.element_to_be_clickable(locator))
+
+
+def invisibility_of_element_located(locator):
+    return BrowserCondition("invisibility", locator, expected_conditions.invisibility_of_element_located(locator))
+
+
+def text_to_be_present_in_element_attribute(locator, attribute, text):
+    return BrowserCondition(
+        "attribute_text", locator,
+        expected_conditions.text_to_be_present_in_element_attribute(locator, attribute, text),
+        expected=[attribute, text],
+    )
+
+
+def text_to_be_present_in_element_value(locator, text):
+    return BrowserCondition(
+        "value_text", locator, expected_conditions.text_to_be_present_in_element_value(locator, text), expected=text
+    )
+
+
+def number_of_windows_to_be(count):
+    # Window handles live outside the page, so this one stays client-side with a short poll.
+    return expected_conditions.number_of_windows_to_be(count)
+
+
+class WebDriverWait(ClientWait):
+    """Drop-in WebDriverWait that resolves page conditions in the browser in one call."""
+
+    def __init__(self, driver, timeout, poll_frequency=CLIENT_POLL, ignored_exceptions=None):
+        super().__init__(driver, timeout, poll_frequency=poll_frequency, ignored_exceptions=ignored_exceptions)
+
+    def until(self, method, message=""):
+        if not isinstance(method, BrowserCondition) or method.locator[0] not in SUPPORTED_STRATEGIES:
+            return super().until(method, message)
+
+        if self._timeout + 2 > DEFAULT_SCRIPT_TIMEOUT:
+            with script_timeout(self._driver, self._timeout + 2):
+                return self._until_in_browser(method, message)
+        return self._until_in_browser(method, message)
+
+    def _until_in_browser(self, method, message):
+        deadline = time.monotonic() + self._timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message or f"{method.kind} of {method.locator} not met in {self._timeout}s")
+            try:
+                result = method.evaluate(self._driver, remaining)
+            except JavascriptException:
+                # The document unloaded mid-wait (navigation, reload); watch the new one.
+                time.sleep(CLIENT_POLL)
+                continue
+            if isinstance(result, dict) and result.get("timeout"):
+                raise TimeoutException(message or f"{method.kind} of {method.locator} not met in {self._timeout}s")
+            return result
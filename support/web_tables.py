@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Execute DemoQA automation scripts in the prescribed order.
+
+Author: Otávio Augusto
+Date: 2026-10-18
+Description:
+- Seed and read the DemoQA Web Tables widget in bulk from inside the browser.
+
+"""
+
+from support.waits import script_timeout
+
+
+FORM_FIELDS = {
+    "firstName": "first_name",
+    "lastName": "last_name",
+    "userEmail": "email",
+    "age": "age",
+    "salary": "salary",
+    "department": "department",
+}
+SCRIPT_TIMEOUT = 300
+
+WAIT_HELPER = """
+const waitFor = (predicate, timeoutMs = 5000) => new Promise((resolve, reject) => {
+  const start = performance.now();
+  (function poll() {
+    const result = predicate();
+    if (result) {
+      resolve(result);
+    } else if (performance.now() - start > timeoutMs) {
+      reject(new Error('timed out waiting for the table to update'));
+    } else {
+      setTimeout(poll, 10);
+    }
+  })();
+});
+const nextFrame = () => new Promise((resolve) => setTimeout(resolve, 0));
+"""
+
+# Drives the real "Add" dialog for every record so the app validates and stores
+# them exactly as it would for a user, just without a round trip per keystroke.
+SEED_SCRIPT = WAIT_HELPER + """
+const records = arguments[0];
+const fields = arguments[1];
+const done = arguments[arguments.length - 1];
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+
+(async () => {
+  let created = 0;
+  try {
+    for (const record of records) {
+      document.getElementById('addNewRecordButton').click();
+      const form = await waitFor(() => document.getElementById('userForm'));
+      for (const [fieldId, key] of Object.entries(fields)) {
+        const input = form.querySelector('#' + fieldId);
+        setter.call(input, String(record[key]));
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+      }
+      form.querySelector('#submit').click();
+      await waitFor(() => !document.getElementById('userForm'));
+      created += 1;
+    }
+    done({ created: created, error: null });
+  } catch (error) {
+    done({ created: created, error: String(error) });
+  }
+})();
+"""
+
+# Rewinds to page one, pages through the whole table reading every cell, and then
+# returns to the page that was showing when it started.
+SNAPSHOT_SCRIPT = WAIT_HELPER + """
+const done = arguments[arguments.length - 1];
+
+const headers = Array.from(document.querySelectorAll("div[role='columnheader']"))
+  .map((header) => header.textContent.trim());
+const pageButton = (label) => Array.from(document.querySelectorAll('.-pagination button'))
+  .find((button) => button.textContent.trim() === label);
+
+const isEnabled = (button) => button && !button.disabled;
+
+(async () => {
+  let startPage = 0;
+  while (isEnabled(pageButton('Previous'))) {
+    pageButton('Previous').click();
+    startPage += 1;
+    await nextFrame();
+  }
+  const rows = [];
+  let pagesMoved = 0;
+  while (true) {
+    for (const row of document.querySelectorAll("div[role='rowgroup'] div[role='row']")) {
+      const cells = Array.from(row.querySelectorAll("div[role='gridcell']"))
+        .map((cell) => cell.textContent.trim());
+      if (cells.some((cell) => cell)) {
+        rows.push(cells);
+      }
+    }
+    const next = pageButton('Next');
+    if (!isEnabled(next)) {
+      break;
+    }
+    next.click();
+    pagesMoved += 1;
+    await nextFrame();
+  }
+  for (let page = startPage; page < pagesMoved; page += 1) {
+    pageButton('Previous').click();
+    await nextFrame();
+  }
+  done({ headers: headers, rows: rows });
+})();
+"""
+
+
+class TableSeedError(RuntimeError):
+    pass
+
+
+def seed_records(driver, records, batch_size=100):
+    created = 0
+    with script_timeout(driver, SCRIPT_TIMEOUT):
+        for offset in range(0, len(records), batch_size):
+            batch = records[offset:offset + batch_size]
+            result = driver.execute_async_script(SEED_SCRIPT, batch, FORM_FIELDS)
+            created += result["created"]
+            if result["error"]:
+                raise TableSeedError(
+                    f"Seeding stopped after {created} of {len(records)} records: {result['error']}"
+                )
+    return created
+
+
+def snapshot_table(driver):
+    with script_timeout(driver, SCRIPT_TIMEOUT):
+        snapshot = driver.execute_async_script(SNAPSHOT_SCRIPT)
+    headers = snapshot["headers"]
+    return [dict(zip(headers, cells)) for cells in snapshot["rows"]]
+
+
+class TableIndex:
+    """In-memory copy of every table row, refreshed lazily after mutations."""
+
+    def __init__(self, driver, key_column="Email"):
+        self.driver = driver
+        self.key_column = key_column
+        self.snapshots = 0
+        self.lookups = 0
+        self._rows = None
+        self._by_column = {}
+
+    def invalidate(self):
+        self._rows = None
+        self._by_column = {}
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            self._rows = snapshot_table(self.driver)
+            self.snapshots += 1
+        return self._rows
+
+    def column(self, name):
+        if name not in self._by_column:
+            index = {}
+            for row in self.rows:
+                index.setdefault(row.get(name, ""), []).append(row)
+            self._by_column[name] = index
+        return self._by_column[name]
+
+    def find(self, value, column=None):
+        self.lookups += 1
+        matches = self.column(column or self.key_column).get(value, [])
+        return matches[0] if matches else None
+
+    def contains(self, value, column=None):
+        return self.find(value, column) is not None
+
+    def missing(self, values, column=None):
+        return [value for value in values if not self.contains(value, column)]
+
+    def present(self, values, column=None):
+        return [value for value in values if self.contains(value, column)]
@@ -0,0 +1,46 @@
+"""Run one load iteration against a stub driver, without a browser."""
+
+from types import SimpleNamespace
+
+import pytest
+from behave.configuration import UserData
+from behave.model import Scenario, Step
+from behave.step_registry import registry
+
+from support.load import LoadRun, percentile
+
+
+STEP_TEXT = "the load check step runs {count:d} times"
+
+
+@pytest.fixture
+def load_check_step():
+    def step(context, count):
+        context.driver.calls += count
+
+    registry.add_step_definition("given", STEP_TEXT, step)
+    yield
+    registry.steps["given"] = [matcher for matcher in registry.steps["given"] if matcher.func is not step]
+
+
+def test_run_iteration_dispatches_steps_through_behave_matches(load_check_step):
+    step = Step("load_check.feature", 3, "Given", "given", "the load check step runs 2 times")
+    scenario = Scenario("load_check.feature", 2, "Scenario", "load check", steps=[step])
+    run = LoadRun(None, scenario, UserData({"settle": "false"}), "http://localhost", 0, 1)
+    driver = SimpleNamespace(calls=0)
+    context = run.session_context(driver, settle_engine=None)
+
+    assert run.run_iteration(context), run.failures
+    assert driver.calls == 2
+    assert run.steps["Given the load check step runs 2 times"]
+
+
+def test_percentile_uses_nearest_rank():
+    samples = list(range(1, 101))
+
+    assert percentile(samples, 0.50) == 50
+    assert percentile(samples, 0.95) == 95
+    assert percentile(samples, 0.99) == 99
+    assert percentile([1, 2], 0.50) == 1
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.95) == 0.0